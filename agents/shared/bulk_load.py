@@ -0,0 +1,259 @@
+from mycelial_base import MycelialNetwork, ProposalNode, Track, PerformanceLevel
+from deployment_tracker import DeploymentNode, DeploymentTracker
+from text_store import intern_list
+import core_metrics
+from datetime import datetime, timedelta
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+import gc
+import os
+import numpy as np
+
+TRACKS = list(Track)
+LEVELS = list(PerformanceLevel)
+
+ArrayLike = Union[np.ndarray, Sequence[int]]
+
+
+def _column(name: str, values, n: int, dtype) -> np.ndarray:
+    array = np.asarray(values, dtype=dtype)
+    if array.shape != (n,):
+        raise ValueError(f"{name} has shape {array.shape}, expected ({n},)")
+    return array
+
+
+def _check_range(name: str, values: np.ndarray, low: int, high: int):
+    bad = np.flatnonzero((values < low) | (values >= high))
+    if bad.size:
+        raise ValueError(f"{name}[{bad[0]}] = {values[bad[0]]} is outside [{low}, {high})")
+
+
+def _edge_array(edges, n: int) -> np.ndarray:
+    array = np.asarray(edges if edges is not None else np.empty((0, 2)), dtype=np.int64)
+    if array.size == 0:
+        return array.reshape(0, 2)
+    if array.ndim != 2 or array.shape[1] != 2:
+        raise ValueError(f"edges has shape {array.shape}, expected (m, 2)")
+    _check_range('edges', array.ravel(), 0, n)
+    loops = np.flatnonzero(array[:, 0] == array[:, 1])
+    if loops.size:
+        raise ValueError(f"edges[{loops[0]}] connects node {array[loops[0], 0]} to itself")
+    return array
+
+
+def _groups(keys: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Stable order of rows grouped by key, plus each key's [start, end) offsets into it"""
+    order = np.argsort(keys, kind='stable')
+    offsets = np.searchsorted(keys[order], np.arange(n + 1))
+    return order, offsets
+
+
+def _grouped(keys: np.ndarray, values: np.ndarray, items: List, n: int
+             ) -> Iterator[Tuple[int, List]]:
+    """(key, [items[value], ...]) for every key in [0, n) that has rows, in row order"""
+    order, offsets = _groups(keys, n)
+    picked = [items[value] for value in values[order].tolist()]
+    bounds = offsets.tolist()
+    for key in np.flatnonzero(np.diff(offsets)).tolist():
+        yield key, picked[bounds[key]:bounds[key + 1]]
+
+
+def topological_depths(parents: np.ndarray) -> np.ndarray:
+    """Depth of every node from one level-by-level pass down from the roots
+
+    parents[i] is the index of i's parent or -1 for a root. Raises ValueError
+    when some nodes never hang off a root, i.e. the parent links contain a cycle.
+    """
+    n = len(parents)
+    depths = np.full(n, -1, dtype=np.int32)
+    has_parent = parents >= 0
+    order, offsets = _groups(np.where(has_parent, parents, n), n)
+    counts = np.diff(offsets)
+
+    frontier = np.flatnonzero(~has_parent)
+    depth = 0
+    while frontier.size:
+        depths[frontier] = depth
+        # Expand every frontier node's children at once
+        sizes = counts[frontier]
+        starts = np.repeat(offsets[frontier] - np.cumsum(sizes) + sizes, sizes)
+        frontier = order[starts + np.arange(sizes.sum())]
+        depth += 1
+
+    unreached = np.flatnonzero(depths < 0)
+    if unreached.size:
+        raise ValueError(f"parents contain a cycle through node {unreached[0]}")
+    return depths
+
+
+# (start, end) of each hex group in an "8-4-4-4-12" UUID string
+UUID_GROUPS = ((0, 8), (9, 13), (14, 18), (19, 23), (24, 36))
+
+
+def _new_ids(n: int) -> List[str]:
+    """n random (version 4) UUID strings, formatted in one array pass instead of per node"""
+    raw = np.frombuffer(os.urandom(16 * n), dtype=np.uint8).reshape(n, 16).copy()
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+    digits = np.frombuffer(raw.tobytes().hex().encode('ascii'), dtype=np.uint8).reshape(n, 32)
+    text = np.full((n, 37), ord('-'), dtype=np.uint8)
+    offset = 0
+    for start, end in UUID_GROUPS:
+        text[:, start:end] = digits[:, offset:offset + end - start]
+        offset += end - start
+    text[:, 36] = ord('\n')
+    return text.tobytes().decode('ascii').splitlines()
+
+
+@contextmanager
+def _gc_paused():
+    """Hold off the cyclic collector while a batch allocates its node objects
+
+    Left running, the collector keeps re-walking the still-growing graph. On
+    the way out, freeze + unfreeze moves the new nodes straight into the
+    oldest generation instead of leaving them to the young-generation passes
+    they would otherwise get as soon as collection resumes. This is process
+    wide: every object the collector tracks at that point, not just the
+    batch, is moved to the oldest generation and is only re-examined by the
+    next full collection.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.freeze()
+            gc.unfreeze()
+            gc.enable()
+
+
+def _texts(name: str, values: Optional[Sequence[str]], n: int, default: str = "") -> Sequence[str]:
+    if values is None:
+        return [default] * n
+    if len(values) != n:
+        raise ValueError(f"{name} has {len(values)} entries, expected {n}")
+    return values
+
+
+def load_network(network: MycelialNetwork, parents: ArrayLike, tracks: ArrayLike,
+                 levels: ArrayLike, titles: Optional[Sequence[str]] = None,
+                 contents: Optional[Sequence[str]] = None,
+                 edges: Optional[ArrayLike] = None) -> List[str]:
+    """Add a whole batch of proposals and connections to network in one go
+
+    parents, tracks and levels are parallel columns: parents[i] is the batch
+    index of node i's parent (-1 for a root), tracks/levels index Track and
+    PerformanceLevel in declaration order. edges is an (m, 2) array of batch
+    indices to connect. All columns are validated before anything is added;
+    returns the new proposal ids in batch order.
+    """
+    return _load_network(network, parents, tracks, levels, titles, contents, edges)[0]
+
+
+def _load_network(network: MycelialNetwork, parents: ArrayLike, tracks: ArrayLike,
+                  levels: ArrayLike, titles: Optional[Sequence[str]],
+                  contents: Optional[Sequence[str]], edges: Optional[ArrayLike]
+                  ) -> Tuple[List[str], List[ProposalNode]]:
+    n = len(parents)
+    parent_column = _column('parents', parents, n, np.int64)
+    track_column = _column('tracks', tracks, n, np.int64)
+    level_column = _column('levels', levels, n, np.int64)
+    _check_range('parents', parent_column, -1, n)
+    _check_range('tracks', track_column, 0, len(TRACKS))
+    _check_range('levels', level_column, 0, len(LEVELS))
+    edge_array = _edge_array(edges, n)
+    titles = _texts('titles', titles, n)
+    contents = _texts('contents', contents, n)
+    depths = topological_depths(parent_column)
+
+    with _gc_paused():
+        ids = _new_ids(n)
+        store = network.text_store
+        if store is not None:
+            contents = [store.put(content) for content in contents]
+        # Connection sets are built first and handed to the constructor, so connected
+        # nodes do not allocate an empty set only to replace it
+        connections: List[Optional[set]] = [None] * n
+        if edge_array.size:
+            sources = np.concatenate((edge_array[:, 0], edge_array[:, 1]))
+            targets = np.concatenate((edge_array[:, 1], edge_array[:, 0]))
+            degree_sum = 0
+            for node, neighbours in _grouped(sources, targets, ids, n):
+                neighbours = connections[node] = set(neighbours)
+                degree_sum += len(neighbours)
+            network.edge_count += degree_sum // 2  # no self-loops, so each edge counts twice
+
+        make = ProposalNode._from_fields
+        nodes = [make(node_id, TRACKS[track], LEVELS[level], depth,
+                      ids[parent] if parent >= 0 else None, title, content, None, linked)
+                 for node_id, track, level, depth, parent, title, content, linked in zip(
+                     ids, track_column.tolist(), level_column.tolist(), depths.tolist(),
+                     parent_column.tolist(), titles, contents, connections)]
+        # Children in batch order, the order create_proposal would have appended them
+        is_root = parent_column < 0
+        for parent, children in _grouped(np.where(is_root, n, parent_column), np.arange(n),
+                                         nodes, n):
+            nodes[parent].sub_proposals = children
+
+        network.proposals.update(zip(ids, nodes))
+        network.root_proposals.extend(nodes[i] for i in np.flatnonzero(is_root).tolist())
+    if core_metrics.ENABLED:
+        core_metrics.PROPOSALS_CREATED.inc(n)
+        core_metrics.CONNECTIONS_CREATED.inc(len(edge_array))
+    return ids, nodes
+
+
+def load_tracker(tracker: DeploymentTracker, parents: ArrayLike, tracks: ArrayLike,
+                 levels: ArrayLike, durations: ArrayLike, start_date: datetime,
+                 budgets: Optional[ArrayLike] = None, titles: Optional[Sequence[str]] = None,
+                 descriptions: Optional[Sequence[str]] = None,
+                 resources: Optional[Sequence[Sequence[str]]] = None,
+                 dependencies: Optional[ArrayLike] = None) -> List[str]:
+    """Add a whole batch of deployment nodes and dependencies to tracker in one go
+
+    Columns follow load_network; durations are whole days from start_date and
+    dependencies is an (m, 2) array of (node, dependency) batch indices.
+    Returns the new node ids in batch order.
+    """
+    n = len(parents)
+    duration_column = _column('durations', durations, n, np.int64)
+    _check_range('durations', duration_column, 0, timedelta.max.days + 1)
+    budget_column = (_column('budgets', budgets, n, np.float64) if budgets is not None
+                     else np.zeros(n))
+    dependency_array = _edge_array(dependencies, n)
+    resources = _texts('resources', resources, n, default=())
+    # Few distinct durations in practice, so end dates are computed once per value. This
+    # is done up front because a date past datetime.max raises before anything is added.
+    end_dates = {days: start_date + timedelta(days=days)
+                 for days in np.unique(duration_column).tolist()}
+
+    with _gc_paused():
+        ids, proposals = _load_network(tracker.network, parents, tracks, levels, titles,
+                                       descriptions, dependency_array)
+
+        node_dependencies: List[Optional[List[str]]] = [None] * n
+        if dependency_array.size:
+            for node, targets in _grouped(dependency_array[:, 0], dependency_array[:, 1], ids, n):
+                node_dependencies[node] = targets
+
+        # Nodes mostly repeat a few resource lists, so each distinct one is interned once
+        # per batch; every node still gets its own list
+        interned = {}
+        make = DeploymentNode._from_fields
+        nodes = []
+        for proposal, days, budget, node_resources, depends_on in zip(
+                proposals, duration_column.tolist(), budget_column.tolist(), resources,
+                node_dependencies):
+            key = tuple(node_resources)
+            names = interned.get(key)
+            if names is None:
+                names = interned[key] = intern_list(key)
+            nodes.append(make(proposal.title, proposal.stored_content, start_date,
+                              end_dates[days], budget, names[:], depends_on))
+
+        tracker.deployment_data.update(zip(ids, nodes))
+    if core_metrics.ENABLED:
+        core_metrics.DEPLOYMENT_NODES_CREATED.inc(n)
+        core_metrics.DEPENDENCIES_ADDED.inc(len(dependency_array))
+    return ids
@@ -0,0 +1,319 @@
+from mycelial_base import MycelialNetwork, Track, PerformanceLevel
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterator, List, Sequence, Union
+import numpy as np
+
+TRACKS = list(Track)
+LEVELS = list(PerformanceLevel)
+TRACK_CODES = {track: code for code, track in enumerate(TRACKS)}
+LEVEL_CODES = {level: code for code, level in enumerate(LEVELS)}
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+FORMATS = ('npz', 'npy', 'arrow')
+
+# A text column is stored as two physical columns, "<name>.offsets" and "<name>.data"
+TEXT_PARTS = ('offsets', 'data')
+
+
+class StringColumn:
+    """Variable-length UTF-8 strings as one byte buffer plus n + 1 offsets into it
+
+    Unlike a fixed-width '<U' array, where every row pays four bytes per
+    character of the longest string, each row costs its encoded length plus
+    one offset, and both parts can be memory-mapped.
+    """
+
+    __slots__ = ('offsets', 'data')
+
+    def __init__(self, offsets: np.ndarray, data: np.ndarray):
+        self.offsets = offsets
+        self.data = data
+
+    @classmethod
+    def from_strings(cls, values: Sequence[str]) -> 'StringColumn':
+        encoded = [value.encode('utf-8') for value in values]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum(np.fromiter(map(len, encoded), np.int64, len(encoded)), out=offsets[1:])
+        return cls(offsets, np.frombuffer(b''.join(encoded), dtype=np.uint8))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(f"string index {i} out of range")
+        return self.data[self.offsets[i]:self.offsets[i + 1]].tobytes().decode('utf-8')
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.tolist())
+
+    def tolist(self) -> List[str]:
+        text = self.data.tobytes()
+        bounds = self.offsets.tolist()
+        return [text[start:end].decode('utf-8') for start, end in zip(bounds, bounds[1:])]
+
+    @property
+    def nbytes(self) -> int:
+        return self.offsets.nbytes + self.data.nbytes
+
+
+Column = Union[np.ndarray, StringColumn]
+Tables = Dict[str, Dict[str, Column]]
+
+
+def _categories(values: List[str]) -> Dict[str, int]:
+    codes: Dict[str, int] = {}
+    for value in values:
+        codes.setdefault(value, len(codes))
+    return codes
+
+
+def _category_table(**categories: List[str]) -> Dict[str, np.ndarray]:
+    return {name: StringColumn.from_strings(values) for name, values in categories.items()}
+
+
+def network_tables(network: MycelialNetwork) -> Tables:
+    """Node and edge tables for a MycelialNetwork, one row per proposal / connection"""
+    ids = list(network.proposals)
+    index = {node_id: i for i, node_id in enumerate(ids)}
+    proposals = [network.proposals[node_id] for node_id in ids]
+
+    sources, targets = [], []
+    for i, proposal in enumerate(proposals):
+        for connected_id in proposal.connections:
+            j = index.get(connected_id)
+            if j is not None and i < j:  # connections are symmetric, keep each once
+                sources.append(i)
+                targets.append(j)
+
+    return {
+        'nodes': {
+            'id': StringColumn.from_strings(ids),
+            'track': np.fromiter((TRACK_CODES[p.track] for p in proposals), np.int8, len(ids)),
+            'level': np.fromiter((LEVEL_CODES[p.performance_level] for p in proposals),
+                                 np.int8, len(ids)),
+            'depth': np.fromiter((p.depth_level for p in proposals), np.int32, len(ids)),
+            'parent': np.fromiter((index.get(p.parent_id, -1) for p in proposals),
+                                  np.int64, len(ids)),
+            'verification_score': np.fromiter((p.verification_score for p in proposals),
+                                              np.float64, len(ids)),
+            'title': StringColumn.from_strings([p.title for p in proposals])
+        },
+        'edges': {
+            'source': np.array(sources, dtype=np.int64),
+            'target': np.array(targets, dtype=np.int64)
+        },
+        'categories': _category_table(track=[t.value for t in TRACKS],
+                                      level=[l.value for l in LEVELS])
+    }
+
+
+def plan_tables(tracker) -> Tables:
+    """Node, dependency, risk, metric and resource tables for a DeploymentTracker"""
+    ids = list(tracker.deployment_data)
+    index = {node_id: i for i, node_id in enumerate(ids)}
+    nodes = [tracker.deployment_data[node_id] for node_id in ids]
+    proposals = [tracker.network.proposals[node_id] for node_id in ids]
+    count = len(ids)
+
+    dep_node, dep_target = [], []
+    risk_node, risk_description, risk_severity = [], [], []
+    metric_node, metric_name, metric_target, metric_current = [], [], [], []
+    resource_node, resource_name = [], []
+    for i, node in enumerate(nodes):
+        for dependency_id in node.dependencies:
+            dep_node.append(i)
+            dep_target.append(index[dependency_id])
+        for risk in node.risks:
+            risk_node.append(i)
+            risk_description.append(risk['description'])
+            risk_severity.append(risk['severity'])
+        for name, metric in node.metrics.items():
+            metric_node.append(i)
+            metric_name.append(name)
+            metric_target.append(metric['target'])
+            metric_current.append(metric['current'])
+        for resource in node.resources:
+            resource_node.append(i)
+            resource_name.append(resource)
+
+    metric_codes = _categories(metric_name)
+    resource_codes = _categories(resource_name)
+
+    return {
+        'nodes': {
+            'id': StringColumn.from_strings(ids),
+            'title': StringColumn.from_strings([n.title for n in nodes]),
+            'description': StringColumn.from_strings([n.description for n in nodes]),
+            'track': np.fromiter((TRACK_CODES[p.track] for p in proposals), np.int8, count),
+            'level': np.fromiter((LEVEL_CODES[p.performance_level] for p in proposals),
+                                 np.int8, count),
+            'parent': np.fromiter((index.get(p.parent_id, -1) for p in proposals),
+                                  np.int64, count),
+            'start_date': np.fromiter((n.start_date.toordinal() - EPOCH_ORDINAL for n in nodes),
+                                      np.int64, count),
+            'end_date': np.fromiter((n.end_date.toordinal() - EPOCH_ORDINAL for n in nodes),
+                                    np.int64, count),
+            'budget': np.fromiter((n.budget for n in nodes), np.float64, count),
+            'progress': np.fromiter((n.progress for n in nodes), np.float64, count)
+        },
+        'edges': {
+            'node': np.array(dep_node, dtype=np.int64),
+            'dependency': np.array(dep_target, dtype=np.int64)
+        },
+        'risks': {
+            'node': np.array(risk_node, dtype=np.int64),
+            'description': StringColumn.from_strings(risk_description),
+            'severity': np.array(risk_severity, dtype=np.float64)
+        },
+        'metrics': {
+            'node': np.array(metric_node, dtype=np.int64),
+            'name': np.array([metric_codes[n] for n in metric_name], dtype=np.int32),
+            'target': np.array(metric_target, dtype=np.float64),
+            'current': np.array(metric_current, dtype=np.float64)
+        },
+        'resources': {
+            'node': np.array(resource_node, dtype=np.int64),
+            'name': np.array([resource_codes[n] for n in resource_name], dtype=np.int32)
+        },
+        'categories': _category_table(track=[t.value for t in TRACKS],
+                                      level=[l.value for l in LEVELS],
+                                      metric=list(metric_codes),
+                                      resource=list(resource_codes))
+    }
+
+
+def _physical_columns(tables: Tables) -> Dict[str, np.ndarray]:
+    """Flatten tables to "<table>.<column>" arrays, splitting each text column in two"""
+    flat = {}
+    for table, columns in tables.items():
+        for column, values in columns.items():
+            if isinstance(values, StringColumn):
+                flat[f"{table}.{column}.offsets"] = values.offsets
+                flat[f"{table}.{column}.data"] = values.data
+            else:
+                flat[f"{table}.{column}"] = values
+    return flat
+
+
+def _logical_tables(flat: Dict[str, np.ndarray]) -> Tables:
+    """Inverse of _physical_columns"""
+    tables: Tables = {}
+    parts: Dict[str, Dict[str, np.ndarray]] = {}
+    for key, values in flat.items():
+        table, column = key.split('.', 1)
+        name, _, part = column.rpartition('.')
+        if part in TEXT_PARTS and name:
+            parts.setdefault(f"{table}.{name}", {})[part] = values
+        else:
+            tables.setdefault(table, {})[column] = values
+    for key, pair in parts.items():
+        table, column = key.split('.', 1)
+        tables.setdefault(table, {})[column] = StringColumn(pair['offsets'], pair['data'])
+    return tables
+
+
+def _npz_path(path: Union[str, Path]) -> Path:
+    """The file np.savez actually writes for path, which gains .npz if it lacks it"""
+    path = Path(path)
+    return path if path.suffix == '.npz' else path.with_name(path.name + '.npz')
+
+
+def _arrow_column(values: Column):
+    import pyarrow as pa
+
+    if isinstance(values, StringColumn):
+        return pa.LargeStringArray.from_buffers(len(values), pa.py_buffer(values.offsets),
+                                                pa.py_buffer(values.data))
+    return pa.array(values)
+
+
+def _from_arrow(column) -> Column:
+    import pyarrow as pa
+
+    array = column.combine_chunks()
+    if pa.types.is_large_string(array.type):
+        _, offsets, data = array.buffers()
+        offsets = np.frombuffer(offsets, dtype=np.int64)[array.offset:array.offset + len(array) + 1]
+        data = np.frombuffer(data, dtype=np.uint8) if data is not None else np.empty(0, np.uint8)
+        return StringColumn(offsets, data)
+    return array.to_numpy()
+
+
+def write_tables(tables: Tables, path: str, format: str = 'npz') -> Path:
+    """Write tables as one .npz, a directory of .npy files, or a directory of Arrow IPC files
+
+    The 'npy' and 'arrow' layouts can be memory-mapped by read_tables; an .npz
+    archive is always read into memory. Table files already in a target
+    directory are replaced, not merged with. Text columns are written as UTF-8
+    bytes plus offsets (native large_string columns in Arrow). Returns the
+    path actually written, which for 'npz' always ends in .npz.
+    """
+    if format not in FORMATS:
+        raise ValueError(f"Unknown columnar format '{format}', expected one of {FORMATS}")
+
+    if format == 'npz':
+        target = _npz_path(path)
+        np.savez(target, **_physical_columns(tables))
+        return target
+
+    directory = Path(path)
+    directory.mkdir(parents=True, exist_ok=True)
+    # read_tables loads every table file it finds, so drop any left by an earlier export
+    for pattern in ('*.npy', '*.arrow'):
+        for stale in directory.glob(pattern):
+            stale.unlink()
+    if format == 'npy':
+        for key, values in _physical_columns(tables).items():
+            np.save(directory / f"{key}.npy", values)
+        return directory
+
+    import pyarrow as pa
+
+    for table, columns in tables.items():
+        # Categories have ragged lengths, so each one becomes its own single-column file
+        groups = ({f"{table}.{c}": {c: v} for c, v in columns.items()}
+                  if table == 'categories' else {table: columns})
+        for name, group in groups.items():
+            arrow_table = pa.table({column: _arrow_column(values)
+                                    for column, values in group.items()})
+            with pa.OSFile(str(directory / f"{name}.arrow"), 'wb') as sink:
+                with pa.ipc.new_file(sink, arrow_table.schema) as writer:
+                    writer.write_table(arrow_table)
+    return directory
+
+
+def read_tables(path: str, mmap: bool = True) -> Tables:
+    """Load tables written by write_tables, memory-mapping them where the format allows
+
+    path may omit the .npz suffix that write_tables adds. Raises
+    FileNotFoundError when it names neither an archive nor a directory of tables.
+    """
+    target = Path(path)
+    if not target.exists() and _npz_path(target).is_file():
+        target = _npz_path(target)
+
+    if target.is_file():
+        with np.load(target) as archive:
+            return _logical_tables({key: archive[key] for key in archive.files})
+
+    npy_files = sorted(target.glob('*.npy')) if target.is_dir() else []
+    arrow_files = sorted(target.glob('*.arrow')) if target.is_dir() else []
+    if not npy_files and not arrow_files:
+        raise FileNotFoundError(f"No columnar tables found at '{path}'")
+
+    tables = _logical_tables({file.stem: np.load(file, mmap_mode='r' if mmap else None)
+                              for file in npy_files})
+    if arrow_files:
+        import pyarrow as pa
+
+        for file in arrow_files:
+            source = pa.memory_map(str(file), 'r') if mmap else pa.OSFile(str(file), 'rb')
+            arrow_table = pa.ipc.open_file(source).read_all()
+            table = file.stem.split('.', 1)[0]
+            for column in arrow_table.column_names:
+                tables.setdefault(table, {})[column] = _from_arrow(arrow_table.column(column))
+    return tables
@@ -0,0 +1,288 @@
+from synthetic_workload import (WorkloadSpec, generate_workload, build_network, build_network_bulk,
+                                build_tracker, build_tracker_bulk, tracker_inputs,
+                                tracker_columns)
+from deployment_tracker import DeploymentTracker
+import bulk_load  # loaded up front so bulk timings exclude the numpy import
+from text_store import TextStore, set_interning
+from typing import Callable, Dict, List, Optional
+from datetime import datetime, timezone
+import argparse
+import gc
+import multiprocessing
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+SCENARIOS = {
+    'small': dict(node_count=1_000, max_depth=6, fan_out=4, connection_density=1.0),
+    'medium': dict(node_count=10_000, max_depth=8, fan_out=4, connection_density=1.0),
+    'large': dict(node_count=100_000, max_depth=10, fan_out=6, connection_density=0.5),
+    'xlarge': dict(node_count=1_000_000, max_depth=12, fan_out=8, connection_density=0.25)
+}
+
+# Slowdowns smaller than this are treated as timer noise, whatever the ratio
+MIN_DELTA_SECONDS = 0.01
+MIN_DELTA_BYTES = 1 << 20
+
+# get_critical_path runs a DFS from every node, so larger scenarios time it on
+# their first CRITICAL_PATH_LIMIT nodes
+CRITICAL_PATH_LIMIT = 5_000
+
+
+def _time(fn: Callable, repeat: int) -> Dict:
+    """Run fn repeat times and return median wall time plus its peak allocation"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'seconds': statistics.median(samples),
+        'min_seconds': min(samples),
+        'peak_bytes': peak
+    }
+
+
+def _record(results: List[Dict], scenario: str, spec: WorkloadSpec, operation: str,
+            calls: int, fn: Callable, repeat: int):
+    entry = {'scenario': scenario, 'operation': operation,
+             'nodes': spec.node_count, 'calls': calls}
+    try:
+        entry.update(_time(fn, repeat))
+        entry['status'] = 'ok'
+        entry['calls_per_second'] = calls / entry['seconds'] if entry['seconds'] else None
+    except RecursionError:
+        entry['status'] = 'recursion_limit'
+    results.append(entry)
+    print(f"  {operation:<28} {entry.get('seconds', float('nan')):>10.4f}s "
+          f"{entry.get('peak_bytes', 0) / 2**20:>9.1f} MiB  [{entry['status']}]")
+
+
+def _speedup(results: List[Dict], per_call: str, bulk: str):
+    """Annotate the bulk entry with how many times faster it was than the per-call path"""
+    entries = {r['operation']: r for r in results if r.get('status') == 'ok'}
+    if per_call in entries and bulk in entries and entries[bulk]['min_seconds']:
+        speedup = entries[per_call]['min_seconds'] / entries[bulk]['min_seconds']
+        entries[bulk]['speedup'] = speedup
+        print(f"  {'':<28} {speedup:>10.1f}x faster than {per_call}")
+
+
+def run_scenario(name: str, spec: WorkloadSpec, repeat: int = 3, samples: int = 100) -> List[Dict]:
+    """Time the hot agent-core operations against one synthetic workload"""
+    results: List[Dict] = []
+    rng = random.Random(spec.seed)
+    print(f"{name}: {spec.node_count:,} nodes, depth {spec.max_depth}, "
+          f"fan-out {spec.fan_out}, {len(spec.edges):,} extra edges")
+
+    _record(results, name, spec, 'create_proposal', spec.node_count,
+            lambda: build_network(spec), repeat)
+    _record(results, name, spec, 'bulk_create_proposal', spec.node_count,
+            lambda: build_network_bulk(spec), repeat)
+    _speedup(results, 'create_proposal', 'bulk_create_proposal')
+    network, ids = build_network(spec)
+
+    leaves = [ids[i] for i in rng.sample(range(spec.node_count), min(samples, spec.node_count))]
+    _record(results, name, spec, 'propagate_verification', len(leaves),
+            lambda: [network.propagate_verification(node_id, 0.1) for node_id in leaves], repeat)
+
+    roots = [proposal.id for proposal in network.root_proposals[:samples]]
+    _record(results, name, spec, 'get_proposal_ecosystem', len(roots),
+            lambda: [network.get_proposal_ecosystem(node_id, max_depth=3) for node_id in roots],
+            repeat)
+    del network
+
+    rows = tracker_inputs(spec)
+    columns = tracker_columns(rows)
+    _record(results, name, spec, 'create_deployment_node', spec.node_count,
+            lambda: build_tracker(spec, rows=rows), repeat)
+    _record(results, name, spec, 'bulk_create_deployment_node', spec.node_count,
+            lambda: build_tracker_bulk(spec, columns=columns), repeat)
+    _speedup(results, 'create_deployment_node', 'bulk_create_deployment_node')
+    tracker, _ = build_tracker(spec, rows=rows)
+    del rows, columns
+
+    if spec.node_count <= CRITICAL_PATH_LIMIT:
+        _record(results, name, spec, 'get_critical_path', 1, tracker.get_critical_path, repeat)
+    else:
+        capped = spec.head(CRITICAL_PATH_LIMIT)
+        capped_tracker, _ = build_tracker(capped)
+        _record(results, name, capped, 'get_critical_path', 1,
+                capped_tracker.get_critical_path, repeat)
+        del capped_tracker
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'plan.json')
+        _record(results, name, spec, 'export_plan', 1, lambda: tracker.export_plan(path), repeat)
+
+    return results
+
+
+def _rss_bytes() -> int:
+    """Current resident set size (Linux /proc), falling back to peak RSS elsewhere"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _measure_tracker_rss(spec: WorkloadSpec, description_size: int, interning: bool,
+                         diet: bool, store_path: Optional[str]) -> int:
+    set_interning(interning)
+    gc.collect()
+    before = _rss_bytes()
+    tracker = DeploymentTracker(TextStore(store_path) if diet else None)
+    build_tracker(spec, tracker=tracker, description_size=description_size)
+    gc.collect()
+    return _rss_bytes() - before
+
+
+def run_memory_benchmark(name: str, spec: WorkloadSpec, description_size: int = 2048
+                         ) -> List[Dict]:
+    """RSS growth of building a tracker with interning, then lazy text storage, added in turn
+
+    The baseline neither interns nor stores text. Each variant is built in a
+    fresh process so allocator state does not leak between them.
+    """
+    results: List[Dict] = []
+    context = multiprocessing.get_context('spawn')
+    print(f"{name} memory: {spec.node_count:,} nodes, {description_size:,}-char descriptions")
+    with tempfile.TemporaryDirectory() as tmp:
+        variants = [('baseline', False, False, None), ('interned', True, False, None),
+                    ('compressed', True, True, None),
+                    ('on_disk', True, True, os.path.join(tmp, 'text.store'))]
+        for variant, interning, diet, store_path in variants:
+            with context.Pool(1) as pool:
+                rss = pool.apply(_measure_tracker_rss,
+                                 (spec, description_size, interning, diet, store_path))
+            results.append({'scenario': name, 'operation': f'memory_{variant}',
+                            'nodes': spec.node_count, 'calls': 1, 'status': 'ok',
+                            'rss_bytes': rss})
+    baseline = results[0]['rss_bytes']
+    for entry in results:
+        entry['rss_ratio'] = entry['rss_bytes'] / baseline if baseline else None
+        print(f"  {entry['operation']:<28} {entry['rss_bytes'] / 2**20:>9.1f} MiB "
+              f"({entry['rss_ratio']:.2f}x)")
+    return results
+
+
+def compare(results: List[Dict], baseline: List[Dict], threshold: float,
+            min_delta: float = MIN_DELTA_SECONDS) -> List[Dict]:
+    """Return entries that are slower than the baseline by more than threshold
+
+    Times are compared on the fastest sample, and a slowdown must also exceed
+    min_delta seconds (MIN_DELTA_BYTES for memory) so sub-millisecond
+    operations do not flag on scheduler jitter.
+    """
+    previous = {(r['scenario'], r['operation']): r for r in baseline if r.get('status') == 'ok'}
+    regressions = []
+    for entry in results:
+        before = previous.get((entry['scenario'], entry['operation']))
+        if not before or entry.get('status') != 'ok':
+            continue
+        if 'rss_bytes' in entry:
+            ratio = entry['rss_bytes'] / before['rss_bytes'] if before['rss_bytes'] else 1.0
+            if (ratio > 1.0 + threshold and
+                    entry['rss_bytes'] - before['rss_bytes'] > MIN_DELTA_BYTES):
+                regressions.append({'scenario': entry['scenario'], 'operation': entry['operation'],
+                                    'time_ratio': 1.0, 'memory_ratio': ratio})
+            continue
+        seconds = entry.get('min_seconds', entry['seconds'])
+        before_seconds = before.get('min_seconds', before['seconds'])
+        ratio = seconds / before_seconds if before_seconds else 1.0
+        memory_ratio = entry['peak_bytes'] / before['peak_bytes'] if before['peak_bytes'] else 1.0
+        slower = ratio > 1.0 + threshold and seconds - before_seconds > min_delta
+        larger = (memory_ratio > 1.0 + threshold and
+                  entry['peak_bytes'] - before['peak_bytes'] > MIN_DELTA_BYTES)
+        if slower or larger:
+            regressions.append({
+                'scenario': entry['scenario'],
+                'operation': entry['operation'],
+                'time_ratio': ratio,
+                'memory_ratio': memory_ratio
+            })
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the shared agent core")
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS),
+                        help="Preset workload (repeatable); defaults to small and medium")
+    parser.add_argument('--nodes', type=int, help="Custom workload node count")
+    parser.add_argument('--depth', type=int, default=8)
+    parser.add_argument('--fan-out', type=int, default=4)
+    parser.add_argument('--density', type=float, default=1.0)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--memory', action='store_true',
+                        help="Also measure RSS with and without text interning/lazy storage")
+    parser.add_argument('--description-size', type=int, default=2048)
+    parser.add_argument('--output', default='bench_results.json')
+    parser.add_argument('--compare', metavar='BASELINE', help="Baseline results file")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="Allowed slowdown before flagging a regression (0.2 = 20%%)")
+    parser.add_argument('--min-delta', type=float, default=MIN_DELTA_SECONDS,
+                        help="Ignore slowdowns smaller than this many seconds")
+    args = parser.parse_args(argv)
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10_000))
+
+    workloads = {}
+    if args.nodes:
+        workloads['custom'] = dict(node_count=args.nodes, max_depth=args.depth,
+                                   fan_out=args.fan_out, connection_density=args.density)
+    for name in args.scenario or ([] if args.nodes else ['small', 'medium']):
+        workloads[name] = SCENARIOS[name]
+
+    results: List[Dict] = []
+    for name, params in workloads.items():
+        spec = generate_workload(seed=args.seed, **params)
+        results.extend(run_scenario(name, spec, repeat=args.repeat))
+        if args.memory:
+            results.extend(run_memory_benchmark(name, spec, args.description_size))
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': args.seed
+        },
+        'results': results
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold, args.min_delta)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.compare}:")
+            for r in regressions:
+                print(f"  {r['scenario']}/{r['operation']}: "
+                      f"time x{r['time_ratio']:.2f}, memory x{r['memory_ratio']:.2f}")
+            return 1
+        print(f"\nNo regressions against {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
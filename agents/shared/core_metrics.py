@@ -0,0 +1,320 @@
+"""Optional instrumentation for the shared agent core.
+
+Everything here is off unless enable() is called or SKENAI_METRICS=1 is set.
+Hot paths only pay for a single module attribute check while disabled.
+"""
+from typing import Callable, Dict, List, Optional, Sequence
+from collections import Counter as _Tally
+import bisect
+import functools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import weakref
+
+ENABLED = os.environ.get('SKENAI_METRICS') == '1'
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0)
+SIZE_BUCKETS = (0, 1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 4096)
+
+
+def enable():
+    global ENABLED
+    ENABLED = True
+
+
+def disable():
+    global ENABLED
+    ENABLED = False
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self.value = 0
+
+    def inc(self, amount: int = 1):
+        self.value += amount
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter",
+                f"{self.name} {self.value}"]
+
+    def snapshot(self):
+        return self.value
+
+
+class Gauge:
+    """Gauge whose value is read from a callback at scrape time"""
+
+    def __init__(self, name: str, help_text: str, read: Callable[[], float]):
+        self.name = name
+        self.help = help_text
+        self.read = read
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} gauge",
+                f"{self.name} {self.read()}"]
+
+    def snapshot(self):
+        return self.read()
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float]):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            lines.append(f'{self.name}_bucket{{le="{bound}"}} {cumulative}')
+        lines.append(f'{self.name}_bucket{{le="+Inf"}} {self.count}')
+        lines.append(f"{self.name}_sum {self.sum}")
+        lines.append(f"{self.name}_count {self.count}")
+        return lines
+
+    def snapshot(self):
+        return {'buckets': dict(zip(map(str, self.buckets + ('+Inf',)), self.counts)),
+                'sum': self.sum, 'count': self.count}
+
+
+class Registry:
+    def __init__(self):
+        self.metrics: Dict[str, object] = {}
+
+    def register(self, metric):
+        self.metrics[metric.name] = metric
+        return metric
+
+    def render_prometheus(self) -> str:
+        lines: List[str] = []
+        for metric in self.metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict:
+        return {name: metric.snapshot() for name, metric in self.metrics.items()}
+
+
+REGISTRY = Registry()
+
+# Networks and trackers register themselves so gauges can be read at scrape time.
+# Scrapes run on other threads, so gauges only read O(1) sizes and counters the
+# owning thread keeps up to date; they never iterate a network's live dicts.
+_networks = weakref.WeakSet()
+_trackers = weakref.WeakSet()
+_watch_lock = threading.Lock()
+
+
+def watch_network(network):
+    with _watch_lock:
+        _networks.add(network)
+
+
+def watch_tracker(tracker):
+    with _watch_lock:
+        _trackers.add(tracker)
+
+
+def _watched(watched: weakref.WeakSet) -> list:
+    with _watch_lock:
+        return list(watched)
+
+
+PROPOSALS_CREATED = REGISTRY.register(Counter(
+    'skenai_proposals_created_total', "Proposals created through MycelialNetwork"))
+CONNECTIONS_CREATED = REGISTRY.register(Counter(
+    'skenai_connections_created_total', "Successful connect_proposals calls"))
+PROPAGATIONS = REGISTRY.register(Counter(
+    'skenai_verification_propagations_total', "Top-level propagate_verification calls"))
+DEPLOYMENT_NODES_CREATED = REGISTRY.register(Counter(
+    'skenai_deployment_nodes_created_total', "Deployment nodes created"))
+DEPENDENCIES_ADDED = REGISTRY.register(Counter(
+    'skenai_dependencies_added_total', "Dependencies added between deployment nodes"))
+
+CASCADE_DEPTH = REGISTRY.register(Histogram(
+    'skenai_verification_cascade_depth', "Parent levels reached by one propagation", SIZE_BUCKETS))
+CASCADE_FANOUT = REGISTRY.register(Histogram(
+    'skenai_verification_cascade_fanout', "Nodes whose score changed in one propagation",
+    SIZE_BUCKETS))
+LATENCY = {
+    name: REGISTRY.register(Histogram(f'skenai_{name}_seconds', f"Latency of {name}",
+                                      LATENCY_BUCKETS))
+    for name in ('propagate_verification', 'get_proposal_ecosystem',
+                 'get_critical_path', 'export_plan')
+}
+
+REGISTRY.register(Gauge('skenai_network_nodes', "Proposal nodes across watched networks",
+                        lambda: sum(len(n.proposals) for n in _watched(_networks))))
+REGISTRY.register(Gauge('skenai_network_edges', "Undirected connections across watched networks",
+                        lambda: sum(n.edge_count for n in _watched(_networks))))
+REGISTRY.register(Gauge('skenai_deployment_nodes', "Deployment nodes across watched trackers",
+                        lambda: sum(len(t.deployment_data) for t in _watched(_trackers))))
+
+
+def timed(name: str):
+    """Record call latency into LATENCY[name] while metrics are enabled"""
+    def decorator(fn):
+        histogram = LATENCY[name]
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return fn(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - started)
+        return wrapper
+    return decorator
+
+
+def observe_cascade(depth: int, touched: int, seconds: float):
+    PROPAGATIONS.inc()
+    CASCADE_DEPTH.observe(depth)
+    CASCADE_FANOUT.observe(touched)
+    LATENCY['propagate_verification'].observe(seconds)
+
+
+class SamplingProfiler:
+    """Statistical profiler that samples every thread's stack on a timer"""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.samples: _Tally = _Tally()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='skenai-profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                    frame = frame.f_back
+                self.samples[";".join(reversed(stack))] += 1
+
+    def collapsed(self) -> str:
+        """Samples in collapsed-stack format, ready for flamegraph tools"""
+        return "\n".join(f"{stack} {count}" for stack, count in self.samples.most_common()) + "\n"
+
+    def reset(self):
+        self.samples.clear()
+
+
+PROFILER = SamplingProfiler()
+
+
+def _routes():
+    return {
+        '/metrics': lambda: ('text/plain; version=0.0.4', REGISTRY.render_prometheus()),
+        '/metrics.json': lambda: ('application/json', json.dumps(REGISTRY.snapshot())),
+        '/profile': lambda: ('text/plain', PROFILER.collapsed()),
+        '/profile/start': lambda: ('text/plain', PROFILER.start() or "profiler started\n"),
+        '/profile/stop': lambda: ('text/plain', PROFILER.stop() or "profiler stopped\n")
+    }
+
+
+def start_http_server(port: int = 9464, addr: str = '127.0.0.1'):
+    """Serve /metrics (Prometheus text), /metrics.json and /profile on a local port"""
+    # Imported here so the agent core does not pay for http.server unless it is used
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            route = _routes().get(self.path.split('?', 1)[0])
+            if route is None:
+                self.send_error(404)
+                return
+            content_type, body = route()
+            payload = body.encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((addr, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name='skenai-metrics-http', daemon=True).start()
+    return server
+
+
+class JsonDumper:
+    """Periodically write the registry snapshot to a JSON file"""
+
+    def __init__(self, filepath: str, interval: float = 60.0):
+        self.filepath = filepath
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='skenai-metrics-dump', daemon=True)
+
+    def start(self) -> 'JsonDumper':
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.dump()
+
+    def dump(self):
+        data = {'timestamp': time.time(), 'metrics': REGISTRY.snapshot()}
+        tmp_path = f"{self.filepath}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.filepath)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.dump()
+            except Exception:
+                # Keep dumping on later ticks rather than letting one failure end the thread
+                logger.exception("metrics dump to %s failed", self.filepath)
+
+
+def start_json_dump(filepath: str, interval: float = 60.0) -> JsonDumper:
+    return JsonDumper(filepath, interval).start()
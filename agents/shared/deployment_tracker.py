@@ -1,27 +1,49 @@
 from mycelial_base import MycelialNetwork, Track, PerformanceLevel
+from text_store import StoredText, TextStore, intern_list, intern_text, resolve
+import core_metrics
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Union
 import json
 
 class DeploymentNode:
-    def __init__(self, title: str, description: str, 
+    def __init__(self, title: str, description: Union[str, StoredText], 
                  start_date: datetime, end_date: datetime,
-                 budget: float, resources: List[str]):
-        self.title = title
-        self.description = description
-        self.start_date = start_date
-        self.end_date = end_date
-        self.budget = budget
-        self.resources = resources
-        self.progress = 0.0
-        self.dependencies = []
-        self.risks = []
-        self.metrics = {}
+                 budget: float, resources: Sequence[str]):
+        # Built by _from_fields, so the field list is spelled out in one place only
+        self.__dict__ = self._from_fields(title, description, start_date, end_date, budget,
+                                          intern_list(resources)).__dict__
+
+    @classmethod
+    def _from_fields(cls, title: str, description: Union[str, StoredText],
+                     start_date: datetime, end_date: datetime, budget: float,
+                     resources: List[str], dependencies: Optional[List[str]] = None
+                     ) -> 'DeploymentNode':
+        """A node built without __init__ (used by bulk_load)
+
+        resources should already be interned; it and dependencies are taken over, not copied.
+        """
+        node = cls.__new__(cls)
+        node.__dict__ = {
+            'title': title, '_description': description, 'start_date': start_date,
+            'end_date': end_date, 'budget': budget, 'resources': resources, 'progress': 0.0,
+            'dependencies': [] if dependencies is None else dependencies,
+            'risks': [], 'metrics': {}
+        }
+        return node
+
+    @property
+    def description(self) -> str:
+        return resolve(self._description)
+
+    @description.setter
+    def description(self, value: Union[str, StoredText]):
+        self._description = value
 
 class DeploymentTracker:
-    def __init__(self):
-        self.network = MycelialNetwork()
+    def __init__(self, text_store: Optional[TextStore] = None):
+        self.network = MycelialNetwork(text_store)
         self.deployment_data: Dict[str, DeploymentNode] = {}
+        core_metrics.watch_tracker(self)
         
     def create_deployment_node(self, track: Track, level: PerformanceLevel,
                              title: str, description: str,
@@ -30,8 +52,6 @@ class DeploymentTracker:
                              parent_id: Optional[str] = None) -> str:
         """Create a new deployment node in the network"""
         end_date = start_date + timedelta(days=duration_days)
-        deployment_data = DeploymentNode(title, description, start_date, 
-                                       end_date, budget, resources)
         
         # Create proposal in mycelial network
         proposal = self.network.create_proposal(
@@ -44,9 +64,23 @@ class DeploymentTracker:
             content=description
         )
         
+        # Share the proposal's (possibly stored) body instead of keeping a second copy
+        deployment_data = DeploymentNode(title, proposal.stored_content, start_date,
+                                       end_date, budget, resources)
         self.deployment_data[proposal.id] = deployment_data
+        if core_metrics.ENABLED:
+            core_metrics.DEPLOYMENT_NODES_CREATED.inc()
         return proposal.id
         
+    def bulk_create_deployment_nodes(self, parents, tracks, levels, durations,
+                                     start_date: datetime, budgets=None, titles=None,
+                                     descriptions=None, resources=None,
+                                     dependencies=None) -> List[str]:
+        """Create many deployment nodes and dependencies from columns; see bulk_load.load_tracker"""
+        from bulk_load import load_tracker
+        return load_tracker(self, parents, tracks, levels, durations, start_date, budgets,
+                            titles, descriptions, resources, dependencies)
+        
     def update_progress(self, node_id: str, progress: float):
         """Update progress of a deployment node"""
         if node_id in self.deployment_data:
@@ -60,23 +94,26 @@ class DeploymentTracker:
             dependency_id in self.deployment_data):
             self.deployment_data[node_id].dependencies.append(dependency_id)
             self.network.connect_proposals(node_id, dependency_id)
+            if core_metrics.ENABLED:
+                core_metrics.DEPENDENCIES_ADDED.inc()
             
     def add_risk(self, node_id: str, risk: str, severity: float):
         """Add a risk to a deployment node"""
         if node_id in self.deployment_data:
             self.deployment_data[node_id].risks.append({
-                'description': risk,
+                'description': intern_text(risk),
                 'severity': severity
             })
             
     def add_metric(self, node_id: str, metric_name: str, target_value: float):
         """Add a success metric to a deployment node"""
         if node_id in self.deployment_data:
-            self.deployment_data[node_id].metrics[metric_name] = {
+            self.deployment_data[node_id].metrics[intern_text(metric_name)] = {
                 'target': target_value,
                 'current': 0.0
             }
             
+    @core_metrics.timed('get_critical_path')
     def get_critical_path(self) -> List[str]:
         """Calculate the critical path through the deployment"""
         nodes = []
@@ -126,6 +163,7 @@ class DeploymentTracker:
                 
         return nodes
         
+    @core_metrics.timed('export_plan')
     def export_plan(self, filepath: str):
         """Export the deployment plan to JSON"""
         plan_data = {
@@ -156,3 +194,8 @@ class DeploymentTracker:
                 
         with open(filepath, 'w') as f:
             json.dump(plan_data, f, indent=2)
+
+    def export_columnar(self, path: str, format: str = 'npz'):
+        """Export the plan as typed column tables for analytics (npz, npy directory or Arrow IPC)"""
+        from columnar_export import plan_tables, write_tables
+        return write_tables(plan_tables(self), path, format)
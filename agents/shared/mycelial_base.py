@@ -1,8 +1,13 @@
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
+import time
 import uuid
 
+import core_metrics
+from score_history import ScoreHistory
+from text_store import StoredText, TextStore, resolve
+
 class Track(Enum):
     GENESIS = "genesis"
     FRACTAL = "fractal"
@@ -21,7 +26,9 @@ class PerformanceLevel(Enum):
     DIAMOND = "diamond"
     LEGEND = "legend"
 
-@dataclass
+# Nodes are compared by identity: the generated field-by-field __eq__ turned every
+# list.remove / `in` over sub_proposals and root_proposals into an O(n) deep compare
+@dataclass(eq=False)
 class ProposalNode:
     id: str
     track: Track
@@ -29,36 +36,87 @@ class ProposalNode:
     depth_level: int
     parent_id: Optional[str]
     title: str
-    content: str
+    _content: Union[str, StoredText]  # exposed as .content, possibly held in a TextStore
     verification_score: float
     sub_proposals: List['ProposalNode']
     connections: Set[str]  # Set of proposal IDs this node is connected to
 
     def __init__(self, track: Track, performance_level: PerformanceLevel, 
                  depth_level: int = 0, parent_id: Optional[str] = None,
-                 title: str = "", content: str = ""):
-        self.id = str(uuid.uuid4())
-        self.track = track
-        self.performance_level = performance_level
-        self.depth_level = depth_level
-        self.parent_id = parent_id
-        self.title = title
-        self.content = content
-        self.verification_score = 0.0
-        self.sub_proposals = []
-        self.connections = set()
+                 title: str = "", content: Union[str, StoredText] = ""):
+        # Built by _from_fields, so the field list is spelled out in one place only
+        self.__dict__ = self._from_fields(str(uuid.uuid4()), track, performance_level,
+                                          depth_level, parent_id, title, content).__dict__
+
+    @classmethod
+    def _from_fields(cls, node_id: str, track: Track, performance_level: PerformanceLevel,
+                     depth_level: int, parent_id: Optional[str], title: str,
+                     content: Union[str, StoredText],
+                     sub_proposals: Optional[List['ProposalNode']] = None,
+                     connections: Optional[Set[str]] = None) -> 'ProposalNode':
+        """A node with a known id, built without __init__ (used by bulk_load)
+
+        sub_proposals and connections are taken over, not copied.
+        """
+        node = cls.__new__(cls)
+        node.__dict__ = {
+            'id': node_id, 'track': track, 'performance_level': performance_level,
+            'depth_level': depth_level, 'parent_id': parent_id, 'title': title,
+            '_content': content, 'verification_score': 0.0,
+            'sub_proposals': [] if sub_proposals is None else sub_proposals,
+            'connections': set() if connections is None else connections
+        }
+        return node
+
+    @property
+    def content(self) -> str:
+        """Proposal body, loaded from the network's TextStore on access when stored there"""
+        return resolve(self._content)
+
+    @content.setter
+    def content(self, value: Union[str, StoredText]):
+        self._content = value
+
+    @property
+    def stored_content(self) -> Union[str, StoredText]:
+        """Body as held, a StoredText handle when the network's TextStore compressed it"""
+        return self._content
+
+def _discard(nodes: List[ProposalNode], node: ProposalNode):
+    """Remove node from a sub-proposal or root list if present"""
+    try:
+        nodes.remove(node)
+    except ValueError:
+        pass
 
 class MycelialNetwork:
-    def __init__(self):
+    def __init__(self, text_store: Optional[TextStore] = None):
         self.proposals: Dict[str, ProposalNode] = {}
         self.root_proposals: List[ProposalNode] = []
+        self.score_history: Optional[ScoreHistory] = None
+        self.text_store = text_store
+        self.edge_count = 0  # undirected connections, kept current for metrics scrapes
+        core_metrics.watch_network(self)
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        core_metrics.watch_network(self)
+
+    def enable_score_history(self, history: Optional[ScoreHistory] = None) -> ScoreHistory:
+        """Start recording every verification score change"""
+        self.score_history = history or ScoreHistory()
+        return self.score_history
 
     def create_proposal(self, track: Track, performance_level: PerformanceLevel,
                        depth_level: int = 0, parent_id: Optional[str] = None,
                        title: str = "", content: str = "") -> ProposalNode:
         """Create a new proposal node in the network"""
+        if self.text_store is not None:
+            content = self.text_store.put(content)
         proposal = ProposalNode(track, performance_level, depth_level, parent_id, title, content)
         self.proposals[proposal.id] = proposal
+        if core_metrics.ENABLED:
+            core_metrics.PROPOSALS_CREATED.inc()
         
         if parent_id:
             parent = self.proposals.get(parent_id)
@@ -69,36 +127,123 @@ class MycelialNetwork:
             
         return proposal
 
+    def bulk_create_proposals(self, parents, tracks, levels, titles=None, contents=None,
+                              edges=None) -> List[str]:
+        """Create many proposals and connections from columns; see bulk_load.load_network"""
+        from bulk_load import load_network
+        return load_network(self, parents, tracks, levels, titles, contents, edges)
+
     def connect_proposals(self, proposal_id1: str, proposal_id2: str) -> bool:
         """Create a bidirectional connection between two proposals"""
         if proposal_id1 not in self.proposals or proposal_id2 not in self.proposals:
             return False
             
+        if proposal_id2 not in self.proposals[proposal_id1].connections:
+            self.edge_count += 1
         self.proposals[proposal_id1].connections.add(proposal_id2)
         self.proposals[proposal_id2].connections.add(proposal_id1)
+        if core_metrics.ENABLED:
+            core_metrics.CONNECTIONS_CREATED.inc()
+        return True
+
+    def disconnect_proposals(self, proposal_id1: str, proposal_id2: str) -> bool:
+        """Remove a bidirectional connection between two proposals"""
+        if proposal_id1 not in self.proposals or proposal_id2 not in self.proposals:
+            return False
+            
+        if proposal_id2 in self.proposals[proposal_id1].connections:
+            self.edge_count -= 1
+        self.proposals[proposal_id1].connections.discard(proposal_id2)
+        self.proposals[proposal_id2].connections.discard(proposal_id1)
+        return True
+
+    def reparent_proposal(self, proposal_id: str, parent_id: Optional[str]) -> bool:
+        """Move a proposal under a new parent, or to the roots when parent_id is None"""
+        proposal = self.proposals.get(proposal_id)
+        if proposal is None or (parent_id is not None and parent_id not in self.proposals):
+            return False
+            
+        old_parent = self.proposals.get(proposal.parent_id) if proposal.parent_id else None
+        _discard(old_parent.sub_proposals if old_parent else self.root_proposals, proposal)
+            
+        proposal.parent_id = parent_id
+        if parent_id:
+            parent = self.proposals[parent_id]
+            parent.sub_proposals.append(proposal)
+            proposal.depth_level = parent.depth_level + 1
+        else:
+            self.root_proposals.append(proposal)
+            proposal.depth_level = 0
+            
+        # Keep descendant depths consistent with the new position
+        stack = [proposal]
+        while stack:
+            node = stack.pop()
+            for sub in node.sub_proposals:
+                sub.depth_level = node.depth_level + 1
+                stack.append(sub)
+        return True
+
+    def remove_proposal(self, proposal_id: str) -> bool:
+        """Remove a proposal and its connections; its sub-proposals become roots"""
+        proposal = self.proposals.get(proposal_id)
+        if proposal is None:
+            return False
+            
+        for sub in list(proposal.sub_proposals):
+            self.reparent_proposal(sub.id, None)
+        for connected_id in list(proposal.connections):
+            self.disconnect_proposals(proposal_id, connected_id)
+        parent = self.proposals.get(proposal.parent_id) if proposal.parent_id else None
+        _discard(parent.sub_proposals if parent else self.root_proposals, proposal)
+        del self.proposals[proposal_id]
         return True
 
     def propagate_verification(self, proposal_id: str, score_delta: float):
         """Propagate verification score changes through the network"""
-        if proposal_id not in self.proposals:
+        if not core_metrics.ENABLED:
+            self._propagate_verification(proposal_id, score_delta)
             return
+        started = time.perf_counter()
+        depth, touched = self._propagate_verification(proposal_id, score_delta)
+        core_metrics.observe_cascade(depth, touched, time.perf_counter() - started)
+
+    def _propagate_verification(self, proposal_id: str, score_delta: float,
+                                source_id: Optional[str] = None) -> Tuple[int, int]:
+        """Apply a score change and cascade it; returns (parent levels reached, nodes touched)"""
+        if proposal_id not in self.proposals:
+            return 0, 0
             
         proposal = self.proposals[proposal_id]
         proposal.verification_score += score_delta
+        depth, touched = 0, 1
+        source_id = source_id or proposal_id
+        history = self.score_history
+        if history is not None:
+            history.record(proposal_id, proposal.verification_score, source_id)
         
         # Propagate to parent
         if proposal.parent_id:
             parent = self.proposals.get(proposal.parent_id)
             if parent:
                 parent_delta = score_delta * 0.5  # Parent gets 50% of child's verification
-                self.propagate_verification(parent.id, parent_delta)
+                parent_depth, parent_touched = self._propagate_verification(
+                    parent.id, parent_delta, source_id)
+                depth, touched = parent_depth + 1, touched + parent_touched
         
         # Propagate to connected proposals
         for connected_id in proposal.connections:
             if connected_id in self.proposals:
                 connection_delta = score_delta * 0.3  # Connected proposals get 30% of verification
-                self.proposals[connected_id].verification_score += connection_delta
+                connected = self.proposals[connected_id]
+                connected.verification_score += connection_delta
+                touched += 1
+                if history is not None:
+                    history.record(connected_id, connected.verification_score, source_id)
+                
+        return depth, touched
 
+    @core_metrics.timed('get_proposal_ecosystem')
     def get_proposal_ecosystem(self, proposal_id: str, max_depth: int = -1) -> List[ProposalNode]:
         """Get all proposals connected to a given proposal within max_depth connections"""
         if proposal_id not in self.proposals:
@@ -125,3 +270,8 @@ class MycelialNetwork:
         
         dfs(proposal_id, 0)
         return ecosystem
+
+    def export_columnar(self, path: str, format: str = 'npz'):
+        """Export nodes and connections as typed columns (npz, npy directory or Arrow IPC)"""
+        from columnar_export import network_tables, write_tables
+        return write_tables(network_tables(self), path, format)
@@ -0,0 +1,343 @@
+from mycelial_base import MycelialNetwork, Track, PerformanceLevel
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+
+TRACK_LETTERS = {
+    'G': Track.GENESIS,
+    'F': Track.FRACTAL,
+    'O': Track.OPTIONS,
+    'R': Track.RESEARCH,
+    'C': Track.COMMUNITY,
+    'E': Track.ARCHIVE
+}
+LEVELS = list(PerformanceLevel)
+
+logger = logging.getLogger(__name__)
+
+FILENAME_PATTERN = re.compile(r'^([A-Z])-L(\d+)-(\d{3})-.+\.md$')
+REFERENCE_PATTERN = re.compile(r'(?:SIP-|\b[A-Z]-L\d+-)(\d{3})\b')
+SECTION_PATTERN = re.compile(r'^(#{2,3})\s+(.+?)\s*$', re.MULTILINE)
+REFERENCE_SECTIONS = ('Dependencies', 'Cross-Track Connections')
+
+
+@dataclass
+class ParsedProposal:
+    sequence: str
+    track: Track
+    level: PerformanceLevel
+    title: str
+    content: str
+    parent: Optional[str]   # parent sequence number
+    references: Set[str]    # sequence numbers of connected proposals
+
+
+@dataclass
+class ChangeSet:
+    added: List[str] = field(default_factory=list)      # node ids
+    updated: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    edges_added: List[Tuple[str, str]] = field(default_factory=list)
+    edges_removed: List[Tuple[str, str]] = field(default_factory=list)
+    scanned: int = 0
+    seconds: float = 0.0
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated or self.removed or
+                    self.edges_added or self.edges_removed)
+
+
+def _sections(text: str) -> Dict[str, str]:
+    """Map each ## / ### heading to the text beneath it"""
+    matches = list(SECTION_PATTERN.finditer(text))
+    return {match.group(2): text[match.end():matches[i + 1].start() if i + 1 < len(matches) else len(text)]
+            for i, match in enumerate(matches)}
+
+
+def parse_proposal(filename: str, text: str) -> Optional[ParsedProposal]:
+    """Parse a governance proposal named like G-L1-002-sbx-tokenomics.md"""
+    match = FILENAME_PATTERN.match(filename)
+    if not match or match.group(1) not in TRACK_LETTERS:
+        return None
+    letter, level, sequence = match.groups()
+
+    title = next((line[2:].strip() for line in text.splitlines() if line.startswith('# ')),
+                 filename[:-3])
+    sections = _sections(text)
+
+    parent = None
+    parent_refs = REFERENCE_PATTERN.findall(sections.get('Parent Proposal', ''))
+    if parent_refs and parent_refs[0] != sequence:
+        parent = parent_refs[0]
+
+    references = set()
+    for name in REFERENCE_SECTIONS:
+        references.update(REFERENCE_PATTERN.findall(sections.get(name, '')))
+    references.discard(sequence)
+
+    return ParsedProposal(
+        sequence=sequence,
+        track=TRACK_LETTERS[letter],
+        level=LEVELS[min(int(level), len(LEVELS) - 1)],
+        title=title,
+        content=text,
+        parent=parent,
+        references=references
+    )
+
+
+class ProposalSync:
+    """Keep a MycelialNetwork in step with a governance/proposals directory
+
+    Each sync() stats the directory, re-reads only files whose mtime or size
+    moved, skips those whose content hash is unchanged, and applies the
+    resulting node, parent and connection diffs in place.
+    """
+
+    def __init__(self, proposals_dir: Union[str, Path], network: Optional[MycelialNetwork] = None):
+        self.proposals_dir = Path(proposals_dir)
+        self.network = network or MycelialNetwork()
+        self.node_ids: Dict[str, str] = {}           # filename -> proposal id
+        self._stats: Dict[str, Tuple[int, int]] = {}  # filename -> (mtime_ns, size)
+        self._hashes: Dict[str, bytes] = {}
+        self._parsed: Dict[str, ParsedProposal] = {}
+        self._by_sequence: Dict[str, Set[str]] = {}   # sequence -> filenames that claim it
+        self._referrers: Dict[str, Set[str]] = {}     # sequence -> filenames that point at it
+        self._declared: Dict[str, Set[str]] = {}      # filename -> filenames it connects to
+        self._subscribers: List[Callable[[ChangeSet], None]] = []
+
+    def __getstate__(self):
+        # Subscribers belong to the running process, not to a saved snapshot
+        state = self.__dict__.copy()
+        state['_subscribers'] = []
+        return state
+
+    def subscribe(self, callback: Callable[[ChangeSet], None]) -> Callable[[], None]:
+        """Call back with every non-empty ChangeSet; returns an unsubscribe function"""
+        self._subscribers.append(callback)
+        return lambda: self._subscribers.remove(callback)
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        stats = {}
+        known = self._stats
+        with os.scandir(self.proposals_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name in known or (FILENAME_PATTERN.match(name) and entry.is_file()):
+                    info = entry.stat()
+                    stats[name] = (info.st_mtime_ns, info.st_size)
+        return stats
+
+    def _stat_paths(self, paths: Iterable[Union[str, Path]]) -> Dict[str, Optional[Tuple[int, int]]]:
+        """Stat only the given files; None marks a file that no longer exists"""
+        stats: Dict[str, Optional[Tuple[int, int]]] = {}
+        for path in paths:
+            name = Path(path).name
+            if not FILENAME_PATTERN.match(name):
+                continue
+            try:
+                info = os.stat(self.proposals_dir / name)
+                stats[name] = (info.st_mtime_ns, info.st_size)
+            except FileNotFoundError:
+                stats[name] = None
+        return stats
+
+    def sync(self, paths: Optional[Iterable[Union[str, Path]]] = None) -> ChangeSet:
+        """Apply on-disk changes since the last sync and notify subscribers
+
+        Without paths the whole directory is stat-scanned. Callers that already
+        know what changed (editor hooks, inotify, git) can pass those paths and
+        skip the scan entirely.
+        """
+        started = time.perf_counter()
+        changes = ChangeSet()
+        if paths is None:
+            stats: Dict[str, Optional[Tuple[int, int]]] = self._scan()
+            stats.update(dict.fromkeys(self._stats.keys() - stats.keys()))
+        else:
+            stats = self._stat_paths(paths)
+        changes.scanned = len(stats)
+
+        changed: Dict[str, Optional[ParsedProposal]] = {}
+        for name, stat in stats.items():
+            if stat is None:
+                if name in self._stats:
+                    del self._stats[name]
+                    self._hashes.pop(name, None)
+                    changed[name] = None
+                continue
+            if self._stats.get(name) == stat:
+                continue
+            try:
+                data = (self.proposals_dir / name).read_bytes()
+            except FileNotFoundError:
+                continue  # deleted since the scan; picked up next time
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            self._stats[name] = stat
+            if self._hashes.get(name) == digest:
+                continue  # touched but not edited
+            self._hashes[name] = digest
+            changed[name] = parse_proposal(name, data.decode('utf-8', errors='replace'))
+
+        affected: Set[str] = set()
+        for name, parsed in changed.items():
+            affected.update(self._apply_node(name, parsed, changes))
+        for name in changed:
+            if name in self._parsed and name not in self.node_ids:
+                self._create_nodes(name, changes)
+        for name in affected:
+            if name in self._parsed:
+                self._apply_structure(name, changes)
+
+        changes.seconds = time.perf_counter() - started
+        if changes:
+            for callback in list(self._subscribers):
+                try:
+                    callback(changes)
+                except Exception:
+                    # One broken subscriber must not stop the others or a running watch()
+                    logger.exception("ProposalSync subscriber %r failed", callback)
+        return changes
+
+    def _owner(self, sequence: Optional[str]) -> Optional[str]:
+        """The file a sequence number resolves to: the smallest filename claiming it
+
+        Sequence numbers are only three digits, so a large archive reuses them;
+        picking by name keeps the choice independent of scan and edit order.
+        """
+        names = self._by_sequence.get(sequence) if sequence else None
+        return min(names) if names else None
+
+    def _claim(self, sequence: str, name: str, add: bool) -> Set[str]:
+        """Add or drop name's claim on sequence; returns referrers to re-resolve if the owner moved"""
+        before = self._owner(sequence)
+        names = self._by_sequence.setdefault(sequence, set())
+        if add:
+            names.add(name)
+        else:
+            names.discard(name)
+            if not names:
+                del self._by_sequence[sequence]
+        if self._owner(sequence) != before:
+            return set(self._referrers.get(sequence, ()))
+        return set()
+
+    def _apply_node(self, name: str, parsed: Optional[ParsedProposal], changes: ChangeSet) -> Set[str]:
+        """Add, update or remove one node; returns filenames whose links need re-resolving"""
+        old = self._parsed.pop(name, None)
+        affected = {name}
+        if old:
+            for sequence in {old.parent, *old.references} - {None}:
+                self._referrers.get(sequence, set()).discard(name)
+            affected.update(self._claim(old.sequence, name, add=False))
+
+        if parsed is None:
+            # Deleted, or no longer a proposal (e.g. unknown track letter). The latter
+            # keeps its stat and hash so it is not re-read on every poll.
+            node_id = self.node_ids.pop(name, None)
+            if node_id:
+                for connected_id in self.network.proposals[node_id].connections:
+                    changes.edges_removed.append((node_id, connected_id))
+                self.network.remove_proposal(node_id)
+                changes.removed.append(node_id)
+            for target in self._declared.pop(name, ()):
+                self._declared.get(target, set()).discard(name)
+            return affected
+
+        self._parsed[name] = parsed
+        for sequence in {parsed.parent, *parsed.references} - {None}:
+            self._referrers.setdefault(sequence, set()).add(name)
+        affected.update(self._claim(parsed.sequence, name, add=True))
+
+        node_id = self.node_ids.get(name)
+        if node_id is not None:
+            proposal = self.network.proposals[node_id]
+            proposal.track = parsed.track
+            proposal.performance_level = parsed.level
+            proposal.title = parsed.title
+            proposal.content = (self.network.text_store.put(parsed.content)
+                                if self.network.text_store is not None else parsed.content)
+            changes.updated.append(node_id)
+        return affected
+
+    def _create_nodes(self, name: str, changes: ChangeSet):
+        """Create a new file's node, creating any new ancestors first so it lands under its parent"""
+        chain = [name]
+        while True:
+            parent = self._owner(self._parsed[chain[-1]].parent)
+            if parent is None or parent in self.node_ids or parent in chain:
+                break
+            chain.append(parent)
+
+        for name in reversed(chain):
+            parsed = self._parsed[name]
+            parent_id = self._resolve(parsed.parent)
+            depth = self.network.proposals[parent_id].depth_level + 1 if parent_id else 0
+            proposal = self.network.create_proposal(parsed.track, parsed.level, depth, parent_id,
+                                                    title=parsed.title, content=parsed.content)
+            self.node_ids[name] = proposal.id
+            changes.added.append(proposal.id)
+
+    def _resolve(self, sequence: Optional[str]) -> Optional[str]:
+        name = self._owner(sequence)
+        return self.node_ids.get(name) if name else None
+
+    def _apply_structure(self, name: str, changes: ChangeSet):
+        """Bring one node's parent and declared connections in line with its file"""
+        parsed = self._parsed[name]
+        node_id = self.node_ids[name]
+        network = self.network
+        proposal = network.proposals[node_id]
+
+        parent_id = self._resolve(parsed.parent)
+        ancestor = parent_id
+        while ancestor:  # refuse parents that would create a cycle
+            if ancestor == node_id:
+                parent_id = None
+                break
+            ancestor = network.proposals[ancestor].parent_id
+        if parent_id != proposal.parent_id:
+            network.reparent_proposal(node_id, parent_id)
+            if node_id not in changes.added and node_id not in changes.updated:
+                changes.updated.append(node_id)
+
+        targets = {self._owner(s) for s in parsed.references} - {None, name}
+        previous = self._declared.get(name, set())
+        for target in targets - previous:
+            target_id = self.node_ids[target]
+            if target_id not in proposal.connections:
+                network.connect_proposals(node_id, target_id)
+                changes.edges_added.append((node_id, target_id))
+        for target in previous - targets:
+            target_id = self.node_ids.get(target)
+            # The edge survives if the other file still declares it
+            if target_id and name not in self._declared.get(target, ()):
+                network.disconnect_proposals(node_id, target_id)
+                changes.edges_removed.append((node_id, target_id))
+        self._declared[name] = targets
+
+    def watch(self, interval: float = 5.0, stop: Optional[threading.Event] = None,
+              changed_paths: Optional[Callable[[], Optional[Iterable[Union[str, Path]]]]] = None):
+        """Sync every interval seconds until stop is set
+
+        By default each tick is a full stat scan, which costs roughly 1s per
+        100k files whether or not anything changed. Pass changed_paths (e.g.
+        draining an inotify/watchdog queue) to sync only the paths it returns;
+        returning None falls back to a full scan, e.g. after the queue overflowed.
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            paths = changed_paths() if changed_paths is not None else None
+            if paths is None:
+                self.sync()
+            else:
+                paths = list(paths)
+                if paths:
+                    self.sync(paths)
+            stop.wait(interval)
@@ -0,0 +1,310 @@
+from array import array
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Tuple
+import sys
+import time
+
+SCORE_SCALE = 1_000_000        # scores are stored as integer micro-units
+ROLLUPS = {
+    'minute': (60_000, 1440),  # resolution in ms, buckets kept
+    'hour': (3_600_000, 720),
+    'day': (86_400_000, 730)
+}
+
+
+def _encode(values: array) -> bytes:
+    """Delta + zigzag + LEB128 varint encoding of an int64 column"""
+    out = bytearray()
+    previous = 0
+    for value in values:
+        delta = value - previous
+        previous = value
+        zigzag = (delta << 1) ^ (delta >> 63)
+        zigzag &= 0xFFFFFFFFFFFFFFFF
+        while zigzag >= 0x80:
+            out.append((zigzag & 0x7F) | 0x80)
+            zigzag >>= 7
+        out.append(zigzag)
+    return bytes(out)
+
+
+def _decode(data: bytes, count: int) -> array:
+    values = array('q')
+    previous = 0
+    position = 0
+    for _ in range(count):
+        shift = 0
+        zigzag = 0
+        while True:
+            byte = data[position]
+            position += 1
+            zigzag |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+        previous += (zigzag >> 1) ^ -(zigzag & 1)
+        values.append(previous)
+    return values
+
+
+class _Ring:
+    """Fixed-width int64 rows in one interleaved column that grows up to
+    capacity, then overwrites the oldest row"""
+
+    __slots__ = ('capacity', 'width', 'data', 'head')
+
+    def __init__(self, capacity: int, width: int):
+        self.capacity = capacity
+        self.width = width
+        self.data = array('q')
+        self.head = 0
+
+    @property
+    def size(self) -> int:
+        return len(self.data) // self.width
+
+    def append(self, *values: int):
+        if self.size < self.capacity:
+            self.data.extend(values)
+            return
+        offset = self.head * self.width
+        self.data[offset:offset + self.width] = array('q', values)
+        self.head = (self.head + 1) % self.capacity
+
+    def rows(self) -> Iterator[Tuple[int, ...]]:
+        size, width = self.size, self.width
+        for offset in range(size):
+            index = (self.head + offset) % size * width
+            yield tuple(self.data[index:index + width])
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.itemsize * len(self.data)
+
+
+# Each open rollup bucket is (start, min, max, last, count); count == 0 means none is open
+_BUCKET = 5
+_ROLLUP_SLOTS = {name: i * _BUCKET for i, name in enumerate(ROLLUPS)}
+
+
+class ScoreSeries:
+    """Bounded score history for one node
+
+    Recent samples sit in a raw block; full blocks are sealed into
+    delta/varint-encoded bytes and kept in a ring of at most max_blocks.
+    Minute/hour/day rollups (min, max, last, count) are updated on every
+    append and outlive the raw samples. Timestamps never go backwards: a
+    sample older than the newest one (clock step, late explicit timestamp)
+    is recorded at the newest timestamp instead.
+
+    A history holds one series per node, so per-series overhead is kept
+    small: raw samples are interleaved (timestamp, value, source) triples in
+    a single array, the open rollup buckets share one array, and the sealed
+    block ring and closed rollup rings are only created once first needed.
+    """
+
+    __slots__ = ('block_size', 'max_blocks', 'raw', 'blocks', 'open', 'rollups', 'last_ms')
+
+    def __init__(self, block_size: int = 256, max_blocks: int = 16):
+        self.block_size = block_size
+        self.max_blocks = max_blocks
+        self.raw = array('q')
+        self.blocks: Optional[deque] = None
+        self.open = array('q', bytes(8 * _BUCKET * len(ROLLUPS)))
+        self.rollups: Optional[Dict[str, _Ring]] = None
+        self.last_ms = -(1 << 63)
+
+    def append(self, timestamp_ms: int, value: int, source: int):
+        # Blocks are pruned by (first, last) and rollups only ever extend the
+        # newest bucket, so both rely on timestamps being non-decreasing
+        if timestamp_ms < self.last_ms:
+            timestamp_ms = self.last_ms
+        self.last_ms = timestamp_ms
+        raw = self.raw
+        raw.append(timestamp_ms)
+        raw.append(value)
+        raw.append(source)
+        if len(raw) >= 3 * self.block_size:
+            self._seal()
+
+        buckets = self.open
+        for name, (resolution, capacity) in ROLLUPS.items():
+            start = timestamp_ms - timestamp_ms % resolution
+            i = _ROLLUP_SLOTS[name]
+            if buckets[i + 4] and buckets[i] == start:
+                if value < buckets[i + 1]:
+                    buckets[i + 1] = value
+                if value > buckets[i + 2]:
+                    buckets[i + 2] = value
+                buckets[i + 3] = value
+                buckets[i + 4] += 1
+                continue
+            if buckets[i + 4]:
+                if self.rollups is None:
+                    self.rollups = {}
+                ring = self.rollups.get(name)
+                if ring is None:
+                    ring = self.rollups[name] = _Ring(capacity, _BUCKET)
+                ring.append(*buckets[i:i + _BUCKET])
+            buckets[i:i + _BUCKET] = array('q', (start, value, value, value, 1))
+
+    def _seal(self):
+        raw = self.raw
+        timestamps = raw[0::3]
+        if self.blocks is None:
+            self.blocks = deque(maxlen=self.max_blocks)
+        self.blocks.append((timestamps[0], timestamps[-1], len(timestamps),
+                            _encode(timestamps), _encode(raw[1::3]), _encode(raw[2::3])))
+        self.raw = array('q')
+
+    def samples(self, start_ms: Optional[int] = None, end_ms: Optional[int] = None
+                ) -> Tuple[array, array, array]:
+        """Retained raw samples with start_ms <= timestamp < end_ms"""
+        timestamps, values, sources = array('q'), array('q'), array('q')
+        chunks = list(self.blocks or ())
+        raw = self.raw
+        if raw:
+            chunks.append((raw[0], raw[-3], len(raw) // 3, raw[0::3], raw[1::3], raw[2::3]))
+
+        for first, last, count, ts, vals, srcs in chunks:
+            if (end_ms is not None and first >= end_ms) or (start_ms is not None and last < start_ms):
+                continue
+            if isinstance(ts, bytes):
+                ts, vals, srcs = _decode(ts, count), _decode(vals, count), _decode(srcs, count)
+            for t, v, s in zip(ts, vals, srcs):
+                if (start_ms is None or t >= start_ms) and (end_ms is None or t < end_ms):
+                    timestamps.append(t)
+                    values.append(v)
+                    sources.append(s)
+        return timestamps, values, sources
+
+    def rollup(self, name: str, start_ms: Optional[int] = None, end_ms: Optional[int] = None
+               ) -> List[Tuple[int, int, int, int, int]]:
+        """(bucket_start, min, max, last, count) rows for a rollup resolution"""
+        i = _ROLLUP_SLOTS[name]
+        ring = self.rollups.get(name) if self.rollups else None
+        rows = list(ring.rows()) if ring is not None else []
+        if self.open[i + 4]:
+            rows.append(tuple(self.open[i:i + _BUCKET]))
+        return [row for row in rows
+                if (start_ms is None or row[0] >= start_ms) and (end_ms is None or row[0] < end_ms)]
+
+    @property
+    def payload_nbytes(self) -> int:
+        """Bytes of retained sample and rollup data, excluding container overhead"""
+        raw = self.raw.itemsize * len(self.raw)
+        sealed = sum(len(block[3]) + len(block[4]) + len(block[5]) for block in self.blocks or ())
+        rings = sum(ring.nbytes for ring in self.rollups.values()) if self.rollups else 0
+        return raw + sealed + rings
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by this series, including the Python objects that hold the data"""
+        size = sys.getsizeof(self) + sys.getsizeof(self.raw) + sys.getsizeof(self.open)
+        if self.blocks is not None:
+            size += sys.getsizeof(self.blocks)
+            for block in self.blocks:
+                size += sys.getsizeof(block) + sum(sys.getsizeof(field) for field in block)
+        if self.rollups is not None:
+            size += sys.getsizeof(self.rollups)
+            for ring in self.rollups.values():
+                size += sys.getsizeof(ring) + sys.getsizeof(ring.data)
+        return size
+
+
+class ScoreHistory:
+    """Verification score history for every node of a MycelialNetwork"""
+
+    def __init__(self, block_size: int = 256, max_blocks: int = 16):
+        self.block_size = block_size
+        self.max_blocks = max_blocks
+        self.series: Dict[str, ScoreSeries] = {}
+        self.source_ids: List[str] = []
+        self._source_index: Dict[str, int] = {}
+
+    def record(self, node_id: str, score: float, source_id: str,
+               timestamp: Optional[float] = None):
+        """Record a node's new score and the proposal whose update caused it"""
+        series = self.series.get(node_id)
+        if series is None:
+            series = self.series[node_id] = ScoreSeries(self.block_size, self.max_blocks)
+        source = self._source_index.get(source_id)
+        if source is None:
+            source = self._source_index[source_id] = len(self.source_ids)
+            self.source_ids.append(source_id)
+        when = time.time() if timestamp is None else timestamp
+        series.append(int(when * 1000), round(score * SCORE_SCALE), source)
+
+    def range(self, node_id: str, start: Optional[float] = None, end: Optional[float] = None
+              ) -> List[Tuple[float, float, str]]:
+        """(timestamp, score, source proposal id) samples for a node in [start, end)"""
+        series = self.series.get(node_id)
+        if series is None:
+            return []
+        timestamps, values, sources = series.samples(
+            None if start is None else int(start * 1000),
+            None if end is None else int(end * 1000))
+        return [(t / 1000, v / SCORE_SCALE, self.source_ids[s])
+                for t, v, s in zip(timestamps, values, sources)]
+
+    def rollup(self, node_id: str, resolution: str = 'minute',
+               start: Optional[float] = None, end: Optional[float] = None) -> List[Dict]:
+        """Downsampled min/max/last/count buckets at 'minute', 'hour' or 'day' resolution"""
+        series = self.series.get(node_id)
+        if series is None:
+            return []
+        rows = series.rollup(resolution,
+                             None if start is None else int(start * 1000),
+                             None if end is None else int(end * 1000))
+        return [{'start': s / 1000, 'min': lo / SCORE_SCALE, 'max': hi / SCORE_SCALE,
+                 'last': last / SCORE_SCALE, 'count': count}
+                for s, lo, hi, last, count in rows]
+
+    def largest_jumps(self, node_id: str, limit: int = 5) -> List[Tuple[float, float, str]]:
+        """The (timestamp, delta, source proposal id) updates that moved a score most"""
+        samples = self.range(node_id)
+        jumps = [(t, score - samples[i - 1][1], source)
+                 for i, (t, score, source) in enumerate(samples) if i > 0]
+        return sorted(jumps, key=lambda jump: abs(jump[1]), reverse=True)[:limit]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by every series, including per-series object overhead
+
+        The node-id keys and the series dict itself are not counted.
+        """
+        return sum(series.nbytes for series in self.series.values())
+
+    @property
+    def payload_nbytes(self) -> int:
+        """Bytes of retained sample and rollup data alone"""
+        return sum(series.payload_nbytes for series in self.series.values())
+
+    def columns(self) -> Dict[str, List]:
+        """All retained samples as flat columns, one row per sample"""
+        node_index, timestamps, values, sources = array('q'), array('q'), array('q'), array('q')
+        node_ids = list(self.series)
+        for index, node_id in enumerate(node_ids):
+            ts, vals, srcs = self.series[node_id].samples()
+            node_index.extend([index] * len(ts))
+            timestamps.extend(ts)
+            values.extend(vals)
+            sources.extend(srcs)
+        return {'node_ids': node_ids, 'source_ids': list(self.source_ids),
+                'node_index': node_index, 'timestamp_ms': timestamps,
+                'score_micros': values, 'source_index': sources}
+
+    def export_npz(self, filepath: str):
+        """Bulk export of all retained samples to a compressed NumPy archive"""
+        import numpy as np
+
+        columns = self.columns()
+        np.savez_compressed(
+            filepath,
+            node_ids=np.array(columns['node_ids'], dtype=str),
+            source_ids=np.array(columns['source_ids'], dtype=str),
+            node_index=np.asarray(columns['node_index'], dtype=np.int64),
+            timestamp_ms=np.asarray(columns['timestamp_ms'], dtype=np.int64),
+            score=np.asarray(columns['score_micros'], dtype=np.int64) / SCORE_SCALE,
+            source_index=np.asarray(columns['source_index'], dtype=np.int64)
+        )
@@ -0,0 +1,208 @@
+from mycelial_base import MycelialNetwork, Track, PerformanceLevel
+from deployment_tracker import DeploymentTracker
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterator, List, Optional, Sequence, Tuple
+import random
+
+TRACKS = list(Track)
+LEVELS = list(PerformanceLevel)
+TEAMS = ['core', 'protocol', 'frontend', 'research', 'security', 'devops', 'community', 'legal']
+WORDS = ['liquidity', 'agent', 'verification', 'proposal', 'treasury', 'oracle', 'vault',
+         'strategy', 'governance', 'deploy', 'audit', 'integration', 'options', 'network',
+         'the', 'of', 'and', 'with', 'for', 'across', 'through', 'each', 'new', 'initial']
+
+
+@dataclass
+class WorkloadSpec:
+    """Seeded description of a synthetic proposal tree and dependency DAG"""
+    node_count: int = 1000
+    max_depth: int = 8
+    fan_out: int = 4
+    connection_density: float = 1.0   # extra edges per node
+    seed: int = 0
+    parents: List[int] = field(default_factory=list)        # -1 for roots
+    depths: List[int] = field(default_factory=list)
+    tracks: List[int] = field(default_factory=list)
+    levels: List[int] = field(default_factory=list)
+    durations: List[int] = field(default_factory=list)
+    budgets: List[float] = field(default_factory=list)
+    edges: List[Tuple[int, int]] = field(default_factory=list)  # (node, dependency)
+
+    def head(self, count: int) -> 'WorkloadSpec':
+        """The first count nodes and the edges among them
+
+        Parents and dependencies always point to earlier nodes, so the prefix
+        is itself a complete workload.
+        """
+        count = min(count, self.node_count)
+        return WorkloadSpec(
+            count, self.max_depth, self.fan_out, self.connection_density, self.seed,
+            parents=self.parents[:count], depths=self.depths[:count],
+            tracks=self.tracks[:count], levels=self.levels[:count],
+            durations=self.durations[:count], budgets=self.budgets[:count],
+            edges=[edge for edge in self.edges if edge[0] < count]
+        )
+
+
+def generate_workload(node_count: int = 1000, max_depth: int = 8, fan_out: int = 4,
+                      connection_density: float = 1.0, seed: int = 0) -> WorkloadSpec:
+    """Generate a reproducible proposal forest plus cross-links
+
+    Nodes are laid out breadth-first so every parent precedes its children.
+    Roots are added whenever the current forest is full, which keeps node_count
+    exact for any depth/fan-out. Dependency edges always point from a node to
+    an earlier one, so the dependency graph stays acyclic.
+    """
+    rng = random.Random(seed)
+    spec = WorkloadSpec(node_count, max_depth, fan_out, connection_density, seed)
+
+    child_counts: List[int] = []
+    cursor = 0
+    for index in range(node_count):
+        # Advance to the next node that can still take children
+        while cursor < index:
+            if spec.depths[cursor] < max_depth and child_counts[cursor] < fan_out:
+                break
+            cursor += 1
+        if cursor < index:
+            parent = cursor
+            child_counts[parent] += 1
+            depth = spec.depths[parent] + 1
+        else:
+            parent, depth = -1, 0
+
+        spec.parents.append(parent)
+        spec.depths.append(depth)
+        spec.tracks.append(rng.randrange(len(TRACKS)) if parent < 0 else spec.tracks[parent])
+        spec.levels.append(min(depth, len(LEVELS) - 1))
+        spec.durations.append(rng.randint(1, 30))
+        spec.budgets.append(round(rng.uniform(1000, 20000), 2))
+        child_counts.append(0)
+
+    extra_edges = int(node_count * connection_density)
+    for _ in range(extra_edges):
+        node = rng.randrange(1, node_count) if node_count > 1 else 0
+        if node == 0:
+            break
+        spec.edges.append((node, rng.randrange(node)))
+
+    return spec
+
+
+def build_network(spec: WorkloadSpec) -> Tuple[MycelialNetwork, List[str]]:
+    """Materialise a spec as a MycelialNetwork through the public per-call API"""
+    network = MycelialNetwork()
+    ids: List[str] = []
+    for index in range(spec.node_count):
+        parent = spec.parents[index]
+        proposal = network.create_proposal(
+            track=TRACKS[spec.tracks[index]],
+            performance_level=LEVELS[spec.levels[index]],
+            depth_level=spec.depths[index],
+            parent_id=ids[parent] if parent >= 0 else None,
+            title=f"Proposal {index}",
+            content=f"Synthetic proposal {index}"
+        )
+        ids.append(proposal.id)
+    for node, dependency in spec.edges:
+        network.connect_proposals(ids[node], ids[dependency])
+    return network, ids
+
+
+def build_network_bulk(spec: WorkloadSpec) -> Tuple[MycelialNetwork, List[str]]:
+    """Same network as build_network, loaded through bulk_create_proposals"""
+    network = MycelialNetwork()
+    ids = network.bulk_create_proposals(
+        spec.parents, spec.tracks, spec.levels,
+        titles=[f"Proposal {index}" for index in range(spec.node_count)],
+        contents=[f"Synthetic proposal {index}" for index in range(spec.node_count)],
+        edges=spec.edges
+    )
+    return network, ids
+
+
+def _description(rng: random.Random, index: int, size: int) -> str:
+    text = f"Synthetic deployment {index}"
+    if size > len(text):
+        words = rng.choices(WORDS, k=size // 7 + 1)
+        text = f"{text}: {' '.join(words)}"[:size]
+    return text
+
+
+def _tracker_rows(spec: WorkloadSpec, description_size: int
+                  ) -> Iterator[Tuple[str, str, List[str]]]:
+    rng = random.Random(spec.seed)
+    for index in range(spec.node_count):
+        yield (f"Deployment {index}", _description(rng, index, description_size),
+               ["-".join((TEAMS[k], "team")) for k in rng.sample(range(len(TEAMS)), 3)])
+
+
+def tracker_inputs(spec: WorkloadSpec, description_size: int = 0
+                   ) -> List[Tuple[str, str, List[str]]]:
+    """Each node's (title, description, resources), generated ahead of a timed build"""
+    return list(_tracker_rows(spec, description_size))
+
+
+def tracker_columns(rows: List[Tuple[str, str, List[str]]]
+                    ) -> Tuple[Sequence[str], Sequence[str], Sequence[List[str]]]:
+    """tracker_inputs() rows transposed to the (titles, descriptions, resources) columns
+    that build_tracker_bulk takes, so a timed bulk build does not pay for the transpose"""
+    return tuple(zip(*rows)) if rows else ((), (), ())
+
+
+def build_tracker(spec: WorkloadSpec, start_date: datetime = datetime(2025, 1, 1),
+                  tracker: Optional[DeploymentTracker] = None, description_size: int = 0,
+                  rows: Optional[List[Tuple[str, str, List[str]]]] = None
+                  ) -> Tuple[DeploymentTracker, List[str]]:
+    """Materialise a spec as a DeploymentTracker through the public per-call API
+
+    Descriptions are padded to description_size characters and each node gets
+    three team names built at runtime, as they would be when parsed from files.
+    Rows are generated as nodes are created unless tracker_inputs() rows are given.
+    """
+    tracker = tracker or DeploymentTracker()
+    ids: List[str] = []
+    rows = _tracker_rows(spec, description_size) if rows is None else rows
+    for index, (title, description, resources) in enumerate(rows):
+        parent = spec.parents[index]
+        ids.append(tracker.create_deployment_node(
+            track=TRACKS[spec.tracks[index]],
+            level=LEVELS[spec.levels[index]],
+            title=title,
+            description=description,
+            start_date=start_date,
+            duration_days=spec.durations[index],
+            budget=spec.budgets[index],
+            resources=resources,
+            parent_id=ids[parent] if parent >= 0 else None
+        ))
+    for node, dependency in spec.edges:
+        tracker.add_dependency(ids[node], ids[dependency])
+    return tracker, ids
+
+
+def build_tracker_bulk(spec: WorkloadSpec, start_date: datetime = datetime(2025, 1, 1),
+                       tracker: Optional[DeploymentTracker] = None, description_size: int = 0,
+                       rows: Optional[List[Tuple[str, str, List[str]]]] = None,
+                       columns: Optional[Tuple[Sequence[str], Sequence[str],
+                                               Sequence[List[str]]]] = None
+                       ) -> Tuple[DeploymentTracker, List[str]]:
+    """Same tracker as build_tracker, loaded through bulk_create_deployment_nodes
+
+    Takes tracker_columns() output as columns, or rows to transpose itself.
+    """
+    tracker = tracker or DeploymentTracker()
+    if columns is None:
+        columns = tracker_columns(tracker_inputs(spec, description_size) if rows is None
+                                  else rows)
+    titles, descriptions, resources = columns
+    ids = tracker.bulk_create_deployment_nodes(
+        spec.parents, spec.tracks, spec.levels, spec.durations, start_date,
+        budgets=spec.budgets,
+        titles=titles,
+        descriptions=descriptions,
+        resources=resources,
+        dependencies=spec.edges
+    )
+    return tracker, ids
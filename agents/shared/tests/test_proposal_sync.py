@@ -0,0 +1,127 @@
+import os
+import random
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from proposal_sync import ProposalSync  # noqa: E402
+
+
+def _write(directory, name, parent=None, references=(), tick=[0]):
+    text = f"# {name}\n"
+    if parent:
+        text += f"\n## Parent Proposal\nSIP-{parent}\n"
+    if references:
+        text += "\n## Dependencies\n" + "".join(f"- SIP-{r}\n" for r in sorted(references))
+    path = directory / name
+    path.write_text(text)
+    # Distinct mtimes, so same-size rewrites within one clock tick are still seen
+    tick[0] += 1
+    os.utime(path, ns=(tick[0] * 1_000_000_000, tick[0] * 1_000_000_000))
+
+
+def _structure(sync):
+    """Parent and connections of every node, by filename, independent of node ids"""
+    names = {node_id: name for name, node_id in sync.node_ids.items()}
+    proposals = sync.network.proposals
+    assert set(names) == set(proposals)
+    return {name: (names.get(proposals[node_id].parent_id),
+                   frozenset(names[c] for c in proposals[node_id].connections))
+            for name, node_id in sync.node_ids.items()}
+
+
+def _assert_matches_rebuild(sync, directory):
+    assert _structure(sync) == _structure(_fresh(directory))
+    assert sync.network.edge_count == sum(
+        len(p.connections) for p in sync.network.proposals.values()) // 2
+
+
+def _fresh(directory):
+    sync = ProposalSync(directory)
+    sync.sync()
+    return sync
+
+
+def test_duplicate_sequence_owner_is_promoted_on_delete(tmp_path):
+    _write(tmp_path, 'G-L1-005-a.md')
+    _write(tmp_path, 'R-L1-005-b.md')
+    _write(tmp_path, 'G-L1-006-c.md', references=['005'])
+    sync = _fresh(tmp_path)
+    _assert_matches_rebuild(sync, tmp_path)
+
+    (tmp_path / 'G-L1-005-a.md').unlink()
+    sync.sync()
+    assert sync.network.edge_count == 1
+    _assert_matches_rebuild(sync, tmp_path)
+
+
+def test_incremental_sync_matches_rebuild(tmp_path):
+    rng = random.Random(0)
+    sequences = [f"{i:03d}" for i in range(1, 9)]  # few sequences, so many collide
+    letters = 'GFORCE'
+
+    def random_file():
+        sequence = rng.choice(sequences)
+        # Parents only point at lower sequences, so parent links never form a cycle
+        lower = [s for s in sequences if s < sequence]
+        parent = rng.choice(lower) if lower and rng.random() < 0.7 else None
+        references = rng.sample(sequences, rng.randint(0, 3))
+        return f"{rng.choice(letters)}-L1-{sequence}-{rng.randrange(1000)}.md", parent, references
+
+    for _ in range(20):
+        _write(tmp_path, *random_file())
+    sync = _fresh(tmp_path)
+
+    for _ in range(60):
+        files = sorted(p.name for p in tmp_path.iterdir())
+        action = rng.random()
+        if action < 0.3 and files:
+            (tmp_path / rng.choice(files)).unlink()
+        elif action < 0.5 and files:
+            # Renumber: the old name disappears and a new one takes its place
+            (tmp_path / rng.choice(files)).unlink()
+            _write(tmp_path, *random_file())
+        elif action < 0.8 and files:
+            _, parent, references = random_file()
+            name = rng.choice(files)
+            sequence = name.split('-')[2]
+            _write(tmp_path, name, parent if parent and parent < sequence else None, references)
+        else:
+            _write(tmp_path, *random_file())
+        sync.sync()
+        _assert_matches_rebuild(sync, tmp_path)
+
+
+def test_failing_subscriber_does_not_stop_others(tmp_path):
+    sync = ProposalSync(tmp_path)
+    seen = []
+
+    def broken(changes):
+        raise RuntimeError("subscriber bug")
+
+    sync.subscribe(broken)
+    sync.subscribe(seen.append)
+    _write(tmp_path, 'G-L1-001-a.md')
+    sync.sync()
+    _write(tmp_path, 'G-L1-002-b.md')
+    sync.sync()
+    assert len(seen) == 2
+
+
+def test_watch_syncs_only_reported_paths(tmp_path):
+    _write(tmp_path, 'G-L1-001-a.md')
+    sync = _fresh(tmp_path)
+    _write(tmp_path, 'G-L1-002-b.md')
+    _write(tmp_path, 'G-L1-003-c.md')
+    stop = threading.Event()
+    reports = [['G-L1-002-b.md'], []]
+
+    def changed_paths():
+        if not reports:
+            stop.set()
+            return []
+        return reports.pop(0)
+
+    sync.watch(interval=0, stop=stop, changed_paths=changed_paths)
+    assert sorted(sync.node_ids) == ['G-L1-001-a.md', 'G-L1-002-b.md']
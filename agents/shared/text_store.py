@@ -0,0 +1,118 @@
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import os
+import sys
+import zlib
+
+# Switched off only to measure what interning saves (core_benchmark --memory)
+INTERNING = True
+
+
+def set_interning(enabled: bool):
+    global INTERNING
+    INTERNING = enabled
+
+
+def intern_text(value: str) -> str:
+    """Share one copy of a repeated short string (team names, metric names, risks)"""
+    return sys.intern(value) if INTERNING else value
+
+
+def intern_list(values: Iterable[str]) -> List[str]:
+    """New list holding one shared copy of each repeated short string, e.g. resources"""
+    return [intern_text(value) for value in values]
+
+
+class StoredText:
+    """Handle to a text body held compressed in a TextStore"""
+    __slots__ = ('store', 'key')
+
+    def __init__(self, store: 'TextStore', key: int):
+        self.store = store
+        self.key = key
+
+    def load(self) -> str:
+        return self.store.get(self.key)
+
+
+class TextStore:
+    """Compressed text bodies kept in memory or in an append-only file
+
+    Bodies shorter than min_size are returned unchanged by put(); larger ones
+    are zlib-compressed and only decompressed on access, with the most recently
+    used cache_size bodies kept decoded. A file-backed store starts from an
+    empty file; pickling it keeps the path, and unpickling reopens that file
+    as is, so the file must outlive the pickle.
+    """
+
+    def __init__(self, path: Optional[str] = None, cache_size: int = 1024,
+                 min_size: int = 256, level: int = 6):
+        self.path = path
+        self.cache_size = cache_size
+        self.min_size = min_size
+        self.level = level
+        self._blobs: List[bytes] = []
+        self._offsets: List[Tuple[int, int]] = []
+        self._file = open(path, 'w+b') if path else None
+        self._cache: 'OrderedDict[int, str]' = OrderedDict()
+
+    def put(self, text: str) -> Union[str, StoredText]:
+        if len(text) < self.min_size:
+            return text
+        blob = zlib.compress(text.encode('utf-8'), self.level)
+        if self._file:
+            self._file.seek(0, os.SEEK_END)
+            self._offsets.append((self._file.tell(), len(blob)))
+            self._file.write(blob)
+            return StoredText(self, len(self._offsets) - 1)
+        self._blobs.append(blob)
+        return StoredText(self, len(self._blobs) - 1)
+
+    def get(self, key: int) -> str:
+        cache = self._cache
+        text = cache.get(key)
+        if text is not None:
+            cache.move_to_end(key)
+            return text
+
+        if self._file:
+            offset, length = self._offsets[key]
+            self._file.flush()
+            self._file.seek(offset)
+            blob = self._file.read(length)
+        else:
+            blob = self._blobs[key]
+        text = zlib.decompress(blob).decode('utf-8')
+
+        cache[key] = text
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return text
+
+    def __getstate__(self):
+        if self._file:
+            self._file.flush()
+        state = self.__dict__.copy()
+        state['_file'] = None
+        state['_cache'] = OrderedDict()
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.path:
+            self._file = open(self.path, 'r+b')
+
+    @property
+    def stored_bytes(self) -> int:
+        if self._file:
+            return sum(length for _, length in self._offsets)
+        return sum(len(blob) for blob in self._blobs)
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+def resolve(value: Union[str, StoredText]) -> str:
+    return value.load() if isinstance(value, StoredText) else value
@@ -3,6 +3,8 @@ from datetime import datetime, timedelta
 import json
 import re
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
 class ProposalGenerator:
     def __init__(self, base_path: str):
         self.base_path = Path(base_path)
@@ -81,8 +83,8 @@ class ProposalGenerator:
         proposal_path.write_text('\n'.join(content))
         return filename
 
-def generate_deployment_proposals():
-    generator = ProposalGenerator('c:/Users/ASUS/CascadeProjects/SKENAI')
+def generate_deployment_proposals(base_path=REPO_ROOT):
+    generator = ProposalGenerator(base_path)
     
     # Define series
     FOUNDATION = "F1"  # Foundation Series
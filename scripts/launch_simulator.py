@@ -0,0 +1,278 @@
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+import os
+import time
+
+import numpy as np
+
+from tokenomics_schedule import VestingSchedule
+
+# Pseudo-bucket for tokens minted by inflation, sold alongside the vesting unlocks
+EMISSION_BUCKET = 'Inflation'
+
+# Mean share of each day's unlock that holders sell into the pool
+DEFAULT_SELL_PROPENSITY = {
+    'SBX Liquidity': 0.0,   # already deposited as pool liquidity
+    'SLAB Treasury': 0.05,
+    'Founders': 0.15,
+    'Options LP': 0.25,
+    'Marketing': 0.35,
+    'Development': 0.2,
+    'Reserve': 0.0,
+    'Private Sale': 0.5,
+    'Public Sale': 0.4,
+    EMISSION_BUCKET: 0.3    # tokens minted by inflation (staking rewards)
+}
+
+
+@dataclass
+class SimulationConfig:
+    paths: int = 100_000
+    seed: int = 0
+    chunk_size: int = 10_000
+    workers: Optional[int] = None
+    swap_fee: float = 0.003
+    sell_propensity: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_SELL_PROPENSITY))
+    propensity_concentration: float = 8.0   # Beta concentration around each mean
+    sell_volatility: float = 0.5            # daily lognormal noise on sell volume
+    daily_buy_demand: float = 0.002         # mean buys per day as a share of initial liquidity
+    buy_volatility: float = 0.8
+    price_bins: int = 1024
+    price_range: Tuple[float, float] = (1e-4, 1e4)  # multiples of the starting price
+    slippage_bins: int = 512
+    slippage_range: Tuple[float, float] = (1e-6, 1.0)  # log-spaced; exact zeros get their own bin
+
+
+@dataclass
+class SimulationResult:
+    days: np.ndarray
+    percentiles: List[float]
+    price: np.ndarray       # (len(percentiles), days)
+    slippage: np.ndarray    # (len(percentiles), days)
+    paths: int
+    seconds: float
+
+    @property
+    def paths_per_second(self) -> float:
+        return self.paths / self.seconds if self.seconds else float('inf')
+
+
+def _simulate_chunk(args) -> Tuple[np.ndarray, np.ndarray]:
+    """Run one block of paths and return per-day price and slippage histograms"""
+    seed, paths, daily_supply, propensity, pool, config = args
+    rng = np.random.default_rng(seed)
+    days, buckets = daily_supply.shape
+    usd_reserve0, token_reserve0 = pool
+    start_price = usd_reserve0 / token_reserve0
+
+    # Each path draws its own holder behaviour once, then gets daily noise on top
+    concentration = config.propensity_concentration
+    a = np.maximum(propensity * concentration, 1e-6)
+    b = np.maximum((1.0 - propensity) * concentration, 1e-6)
+    path_propensity = rng.beta(a, b, size=(paths, buckets))
+    path_propensity[:, propensity == 0.0] = 0.0
+
+    usd = np.full(paths, usd_reserve0)
+    tokens = np.full(paths, token_reserve0)
+    fee = 1.0 - config.swap_fee
+
+    log_low, log_high = np.log(config.price_range[0]), np.log(config.price_range[1])
+    bin_scale = config.price_bins / (log_high - log_low)
+    price_hist = np.zeros((days, config.price_bins), dtype=np.int64)
+    slip_low, slip_high = np.log(config.slippage_range[0]), np.log(config.slippage_range[1])
+    slip_scale = config.slippage_bins / (slip_high - slip_low)
+    # Bin 0 counts paths with no sells that day; bins 1..slippage_bins are log-spaced
+    slip_hist = np.zeros((days, config.slippage_bins + 1), dtype=np.int64)
+    buy_mean = config.daily_buy_demand * usd_reserve0
+    sell_sigma = config.sell_volatility
+    buy_sigma = config.buy_volatility
+
+    for day in range(days):
+        # Sell side: unlocked and newly minted tokens swapped into the pool
+        sells = path_propensity @ daily_supply[day]
+        sells *= rng.lognormal(-0.5 * sell_sigma ** 2, sell_sigma, paths)
+        spot = usd / tokens
+        effective = sells * fee
+        usd_out = usd * effective / (tokens + effective)
+        slippage = np.where(sells > 0, 1.0 - usd_out / np.maximum(sells * spot, 1e-300), 0.0)
+        tokens += effective
+        usd -= usd_out
+
+        # Buy side: fresh demand swapped back out of the pool
+        buys = buy_mean * rng.lognormal(-0.5 * buy_sigma ** 2, buy_sigma, paths) * fee
+        tokens_out = tokens * buys / (usd + buys)
+        usd += buys
+        tokens -= tokens_out
+
+        log_price = np.log(usd / tokens / start_price)
+        price_bin = ((log_price - log_low) * bin_scale).astype(np.int64)
+        np.clip(price_bin, 0, config.price_bins - 1, out=price_bin)
+        price_hist[day] = np.bincount(price_bin, minlength=config.price_bins)
+        sold = slippage > 0
+        slip_bin = np.zeros(paths, dtype=np.int64)
+        slip_bin[sold] = 1 + ((np.log(slippage[sold]) - slip_low) * slip_scale).astype(np.int64)
+        np.clip(slip_bin, 0, config.slippage_bins, out=slip_bin)
+        slip_hist[day] = np.bincount(slip_bin, minlength=config.slippage_bins + 1)
+
+    return price_hist, slip_hist
+
+
+def _histogram_percentiles(hist: np.ndarray, lower: np.ndarray, upper: np.ndarray,
+                           percentiles: List[float]) -> np.ndarray:
+    """Interpolate percentiles for every row of a (days, bins) histogram
+
+    lower/upper hold each bin's bounds, so a bin can be a single point (lower == upper).
+    """
+    cumulative = np.cumsum(hist, axis=1, dtype=np.float64)
+    total = cumulative[:, -1:]
+    result = np.empty((len(percentiles), hist.shape[0]))
+    for i, p in enumerate(percentiles):
+        target = total[:, 0] * p / 100.0
+        idx = np.argmax(cumulative >= target[:, None], axis=1)
+        below = np.where(idx > 0, cumulative[np.arange(len(idx)), idx - 1], 0.0)
+        count = np.maximum(hist[np.arange(len(idx)), idx], 1)
+        frac = np.clip((target - below) / count, 0.0, 1.0)
+        result[i] = lower[idx] + frac * (upper[idx] - lower[idx])
+    return result
+
+
+class LaunchSimulator:
+    """Monte Carlo model of SBX price and pool slippage over the unlock schedule"""
+
+    def __init__(self, schedule: VestingSchedule, config: Optional[SimulationConfig] = None):
+        self.schedule = schedule
+        self.config = config or SimulationConfig()
+        scalars = schedule.sheet.scalars
+        self.initial_liquidity = scalars['Initial Liquidity']
+        self.starting_price = scalars['Starting Price']
+
+    @classmethod
+    def from_csv(cls, filepath, config: Optional[SimulationConfig] = None) -> 'LaunchSimulator':
+        return cls(VestingSchedule.from_csv(filepath), config)
+
+    def _propensity(self) -> np.ndarray:
+        mapping = self.config.sell_propensity
+        return np.array([mapping.get(name, 0.0)
+                         for name in [*self.schedule.buckets, EMISSION_BUCKET]])
+
+    def _daily_supply(self) -> np.ndarray:
+        """Tokens that reach holders each day: every bucket's unlock, then inflation"""
+        return np.column_stack((self.schedule.daily_unlocks, self.schedule.daily_emission))
+
+    def _tasks(self) -> List[tuple]:
+        config = self.config
+        pool = (self.initial_liquidity, self.initial_liquidity / self.starting_price)
+        propensity = self._propensity()
+        daily_supply = self._daily_supply()
+        sizes = [config.chunk_size] * (config.paths // config.chunk_size)
+        if config.paths % config.chunk_size:
+            sizes.append(config.paths % config.chunk_size)
+        # Seeds depend only on the chunk layout, so results ignore worker count
+        seeds = np.random.SeedSequence(config.seed).spawn(len(sizes))
+        return [(seed, size, daily_supply, propensity, pool, config)
+                for seed, size in zip(seeds, sizes)]
+
+    def run(self, percentiles: Optional[List[float]] = None) -> SimulationResult:
+        """Simulate all paths and reduce them to per-day percentiles"""
+        percentiles = percentiles or [5, 25, 50, 75, 95]
+        config = self.config
+        tasks = self._tasks()
+        started = time.perf_counter()
+
+        workers = config.workers or os.cpu_count() or 1
+        if workers == 1 or len(tasks) == 1:
+            results = map(_simulate_chunk, tasks)
+            price_hist, slip_hist = self._merge(results)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                price_hist, slip_hist = self._merge(pool.map(_simulate_chunk, tasks))
+        seconds = time.perf_counter() - started
+
+        log_edges = np.linspace(np.log(config.price_range[0]), np.log(config.price_range[1]),
+                                config.price_bins + 1)
+        price_edges = self.starting_price * np.exp(log_edges)
+        # Same log scale as _simulate_chunk, behind a zero-width bin for no-sell paths
+        slip_edges = np.exp(np.linspace(np.log(config.slippage_range[0]),
+                                        np.log(config.slippage_range[1]),
+                                        config.slippage_bins + 1))
+        slip_lower = np.concatenate(([0.0], slip_edges[:-1]))
+        slip_upper = np.concatenate(([0.0], slip_edges[1:]))
+        return SimulationResult(
+            days=self.schedule.days,
+            percentiles=percentiles,
+            price=_histogram_percentiles(price_hist, price_edges[:-1], price_edges[1:],
+                                         percentiles),
+            slippage=_histogram_percentiles(slip_hist, slip_lower, slip_upper, percentiles),
+            paths=config.paths,
+            seconds=seconds
+        )
+
+    @staticmethod
+    def _merge(results) -> Tuple[np.ndarray, np.ndarray]:
+        price_hist = slip_hist = None
+        for price, slip in results:
+            if price_hist is None:
+                price_hist, slip_hist = price, slip
+            else:
+                price_hist += price
+                slip_hist += slip
+        return price_hist, slip_hist
+
+
+def benchmark(csv_path, paths: int = 100_000, workers: Optional[int] = None) -> Dict:
+    """Measure simulator throughput in paths and path-days per second"""
+    simulator = LaunchSimulator.from_csv(csv_path, SimulationConfig(paths=paths, workers=workers))
+    result = simulator.run()
+    days = len(result.days)
+    return {
+        'paths': paths,
+        'days': days,
+        'workers': workers or os.cpu_count(),
+        'seconds': result.seconds,
+        'paths_per_second': result.paths_per_second,
+        'path_days_per_second': result.paths_per_second * days
+    }
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="SBX launch Monte Carlo simulator")
+    parser.add_argument('--csv', default=str(Path(__file__).resolve().parents[1] / 'SBX_LEGACY_TOKENOMICS.csv'))
+    parser.add_argument('--paths', type=int, default=100_000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--every', type=int, default=90, help="Report every N days")
+    parser.add_argument('--benchmark', action='store_true')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        stats = benchmark(args.csv, args.paths, args.workers)
+        print(f"{stats['paths']:,} paths x {stats['days']:,} days on {stats['workers']} workers: "
+              f"{stats['seconds']:.2f}s ({stats['paths_per_second']:,.0f} paths/s, "
+              f"{stats['path_days_per_second']:,.0f} path-days/s)")
+        return
+
+    config = SimulationConfig(paths=args.paths, seed=args.seed, workers=args.workers)
+    result = LaunchSimulator.from_csv(args.csv, config).run()
+
+    print("SBX Launch Simulation:")
+    print("=" * 80)
+    header = "  ".join(f"p{p:<8}" for p in result.percentiles)
+    print(f"{'Date':<12}Price  {header}")
+    for i in range(0, len(result.days), args.every):
+        prices = "  ".join(f"{v:<9.4f}" for v in result.price[:, i])
+        print(f"{str(result.days[i]):<12}       {prices}")
+
+    print(f"\n{'Date':<12}Slip   {header}")
+    for i in range(0, len(result.days), args.every):
+        slips = "  ".join(f"{f'{v * 100:.3f}%':<9}" for v in result.slippage[:, i])
+        print(f"{str(result.days[i]):<12}       {slips}")
+
+    print(f"\n{result.paths:,} paths in {result.seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,11 @@
 from pathlib import Path
-from proposal_structure import ProposalStructure
+from proposal_structure import ProposalStructure, REPO_ROOT
 import shutil
 import re
 from datetime import datetime
 
-def migrate_proposals():
-    structure = ProposalStructure('c:/Users/ASUS/CascadeProjects/SKENAI')
+def migrate_proposals(base_path=REPO_ROOT):
+    structure = ProposalStructure(base_path)
     proposals_dir = structure.proposals_path
     migrations = structure.migrate_proposals()
     
@@ -1,5 +1,5 @@
 from pathlib import Path
-from proposal_structure import ProposalStructure
+from proposal_structure import ProposalStructure, REPO_ROOT
 import shutil
 import re
 from datetime import datetime
@@ -8,8 +8,8 @@ def get_sequence_number(filename):
     match = re.search(r'(\d{3})', filename)
     return match.group(1) if match else '000'
 
-def migrate_proposals():
-    structure = ProposalStructure('c:/Users/ASUS/CascadeProjects/SKENAI')
+def migrate_proposals(base_path=REPO_ROOT):
+    structure = ProposalStructure(base_path)
     proposals_dir = structure.proposals_path
     migrations = structure.migrate_proposals()
     
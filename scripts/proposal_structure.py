@@ -3,6 +3,8 @@ import re
 from datetime import datetime
 from typing import Dict, List, Tuple
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
 class ProposalStructure:
     TRACK_MAPPING = {
         'G': 'Genesis',
@@ -123,8 +125,8 @@ class ProposalStructure:
             
         return migrations
 
-def main():
-    structure = ProposalStructure('c:/Users/ASUS/CascadeProjects/SKENAI')
+def main(base_path=REPO_ROOT):
+    structure = ProposalStructure(base_path)
     migrations = structure.migrate_proposals()
     
     print("Proposed Migrations:")
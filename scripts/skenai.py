@@ -0,0 +1,236 @@
+"""skenai - single entry point for the proposal tooling.
+
+Only os, sys and time are imported up front; argparse and each subcommand's
+dependencies load on demand, so `skenai --help` stays cheap. Scanned proposal
+state is cached in a binary snapshot, keyed to the code that wrote it, and
+brought up to date incrementally.
+"""
+import os
+import sys
+import time
+
+# Plain strings here: pathlib alone costs more import time than the whole --help path
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+SNAPSHOT_MAGIC = b'SKENAI-SNAPSHOT\n'
+# Modules whose parsing or pickled classes end up in a snapshot; editing any of
+# them invalidates existing snapshots instead of resuming from stale state
+SNAPSHOT_MODULES = ('proposal_sync', 'mycelial_base', 'score_history', 'text_store')
+
+_started = time.perf_counter()
+_timings = []
+
+
+def _mark(label: str):
+    _timings.append((label, time.perf_counter()))
+
+
+def _use_path(*parts: str):
+    path = os.path.join(REPO_ROOT, *parts)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+def _snapshot_fingerprint() -> bytes:
+    """Digest of the snapshot format and the source of every SNAPSHOT_MODULES module"""
+    import hashlib
+    import importlib
+
+    digest = hashlib.blake2b(SNAPSHOT_MAGIC, digest_size=16)
+    for name in SNAPSHOT_MODULES:
+        with open(importlib.import_module(name).__file__, 'rb') as f:
+            digest.update(f.read())
+    return digest.digest()
+
+
+def load_state(root: str, use_snapshot: bool = True):
+    """Return an up-to-date ProposalSync, resuming from the snapshot when it is valid
+
+    The snapshot is unpickled, and unpickling can run arbitrary code: anyone
+    who can write <root>/.skenai/snapshot.bin can run code as the caller, so
+    that directory must be as trusted as the repository itself. Pass
+    use_snapshot=False (--no-snapshot) to skip it.
+    """
+    _use_path('agents', 'shared')
+    from pathlib import Path
+    import pickle
+    from proposal_sync import ProposalSync
+
+    proposals_dir = Path(root) / 'governance' / 'proposals'
+    fingerprint = _snapshot_fingerprint() if use_snapshot else b''
+    snapshot = Path(root) / '.skenai' / 'snapshot.bin'
+    state = None
+    if use_snapshot and snapshot.exists():
+        with open(snapshot, 'rb') as f:
+            expected = SNAPSHOT_MAGIC + fingerprint
+            if f.read(len(expected)) == expected:
+                try:
+                    saved_dir, state = pickle.load(f)
+                except Exception:
+                    # A truncated or corrupt snapshot can fail in many ways; rebuild instead
+                    state = None
+                if state is not None and saved_dir != str(proposals_dir):
+                    state = None
+        _mark('snapshot load')
+
+    if state is None:
+        state = ProposalSync(proposals_dir)
+    changes = state.sync()
+    _mark('sync')
+
+    if use_snapshot and (changes or not snapshot.exists()):
+        snapshot.parent.mkdir(exist_ok=True)
+        tmp_path = snapshot.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(SNAPSHOT_MAGIC + fingerprint)
+            pickle.dump((str(proposals_dir), state), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, snapshot)
+        _mark('snapshot save')
+    return state
+
+
+def build_tracker(state, start):
+    """DeploymentTracker for the synced proposals, using each file's budget and duration"""
+    import re
+    from datetime import datetime
+    from deployment_tracker import DeploymentTracker
+
+    budget_pattern = re.compile(r'^## Budget\s*\n\$([\d,]+(?:\.\d+)?)', re.MULTILINE)
+    duration_pattern = re.compile(r'Duration:\s*(\d+)\s*days')
+    start_date = datetime.fromisoformat(start) if start else datetime.now()
+
+    names = {node_id: name for name, node_id in state.node_ids.items()}
+    # (sequence, filename) orders proposals, e.g. G-L1-002-sbx-tokenomics.md -> ('002', ...)
+    order = {node_id: (name.split('-')[2], name) for node_id, name in names.items()}
+    network = state.network
+    tracker = DeploymentTracker()
+    plan_ids = {}
+
+    # Parents before children so create_deployment_node can resolve depth
+    stack = sorted(network.root_proposals, key=lambda p: order[p.id], reverse=True)
+    while stack:
+        proposal = stack.pop()
+        content = proposal.content
+        budget = budget_pattern.search(content)
+        duration = duration_pattern.search(content)
+        plan_ids[proposal.id] = tracker.create_deployment_node(
+            track=proposal.track,
+            level=proposal.performance_level,
+            title=proposal.title,
+            description=content,
+            start_date=start_date,
+            duration_days=int(duration.group(1)) if duration else 14,
+            budget=float(budget.group(1).replace(',', '')) if budget else 0.0,
+            resources=[],
+            parent_id=plan_ids.get(proposal.parent_id)
+        )
+        stack.extend(sorted(proposal.sub_proposals, key=lambda p: order[p.id], reverse=True))
+
+    # Connections are undirected; the later proposal depends on the earlier one
+    for node_id, proposal in network.proposals.items():
+        for connected_id in proposal.connections:
+            if order[connected_id] < order[node_id]:
+                tracker.add_dependency(plan_ids[node_id], plan_ids[connected_id])
+    return tracker
+
+
+def cmd_list(args):
+    state = load_state(args.root, not args.no_snapshot)
+    for name in sorted(state.node_ids):
+        proposal = state.network.proposals[state.node_ids[name]]
+        print(f"{name:<60} {proposal.track.value:<10} {proposal.performance_level.value:<8} "
+              f"{proposal.title}")
+
+
+def cmd_migrate(args):
+    _use_path('scripts')
+    if args.apply:
+        from migrate_proposals_v3 import migrate_proposals
+        migrate_proposals(args.root)
+        return
+    from proposal_structure import ProposalStructure
+
+    structure = ProposalStructure(args.root)
+    migrations = structure.migrate_proposals()
+    if not migrations:
+        print("No legacy proposals to migrate.")
+    for migration in migrations:
+        print(f"{migration['old_name']} -> {migration['new_name']}")
+
+
+def cmd_generate(args):
+    _use_path('scripts')
+    from generate_deployment_proposals import generate_deployment_proposals
+
+    generate_deployment_proposals(args.root)
+
+
+def cmd_plan(args):
+    state = load_state(args.root, not args.no_snapshot)
+    tracker = build_tracker(state, args.start)
+    if args.format == 'json':
+        tracker.export_plan(args.output)
+    else:
+        tracker.export_columnar(args.output, args.format)
+    print(f"Exported {len(tracker.deployment_data)} deployment nodes to {args.output}")
+
+
+def cmd_critical_path(args):
+    state = load_state(args.root, not args.no_snapshot)
+    tracker = build_tracker(state, args.start)
+    total = 0
+    for node_id in tracker.get_critical_path():
+        node = tracker.deployment_data[node_id]
+        days = (node.end_date - node.start_date).days
+        total += days
+        print(f"{days:>4}d  {node.title}")
+    print(f"{total:>4}d  total")
+
+
+def build_parser():
+    import argparse
+
+    parser = argparse.ArgumentParser(prog='skenai', description="SKENAI proposal tooling")
+    parser.add_argument('--root', default=os.environ.get('SKENAI_ROOT', REPO_ROOT),
+                        help="Repository root (default: this checkout or $SKENAI_ROOT)")
+    parser.add_argument('--no-snapshot', action='store_true',
+                        help="Rescan proposals without reading or writing the state snapshot")
+    parser.add_argument('--timings', action='store_true', help="Print startup phase timings")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('list', help="List governance proposals").set_defaults(handler=cmd_list)
+
+    migrate = commands.add_parser('migrate', help="Show or apply legacy proposal renames")
+    migrate.add_argument('--apply', action='store_true', help="Rename files (backs up originals)")
+    migrate.set_defaults(handler=cmd_migrate)
+
+    commands.add_parser('generate', help="Generate the deployment proposal series"
+                        ).set_defaults(handler=cmd_generate)
+
+    for name, handler, help_text in (('plan', cmd_plan, "Export the deployment plan"),
+                                     ('critical-path', cmd_critical_path,
+                                      "Print the deployment critical path")):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument('--start', help="Plan start date (YYYY-MM-DD, default today)")
+        command.set_defaults(handler=handler)
+        if name == 'plan':
+            command.add_argument('--output', default='deployment_plan.json')
+            command.add_argument('--format', choices=('json', 'npz', 'npy', 'arrow'), default='json')
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    _mark('parse')
+    args.handler(args)
+    _mark('command')
+    if args.timings:
+        previous = _started
+        for label, moment in _timings:
+            print(f"{label:<14} {(moment - previous) * 1000:8.1f} ms", file=sys.stderr)
+            previous = moment
+        print(f"{'total':<14} {(previous - _started) * 1000:8.1f} ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
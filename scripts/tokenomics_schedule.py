@@ -0,0 +1,253 @@
+from pathlib import Path
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Union
+import csv
+
+import numpy as np
+
+DateLike = Union[str, date, datetime, np.datetime64]
+
+SCALAR_COLUMNS = [
+    'Initial Supply',
+    'Total Supply',
+    'Initial Liquidity',
+    'Starting Price',
+    'MCAP',
+    'Inflation (YOY)',
+    'Daily Inflation'
+]
+
+
+def parse_number(value: str) -> float:
+    """Parse a spreadsheet cell like '$1,250,000', '25.00%' or '6,250,000'"""
+    text = value.strip().replace(',', '').replace('$', '')
+    if not text:
+        return float('nan')
+    try:
+        if text.endswith('%'):
+            return float(text[:-1]) / 100.0
+        return float(text)
+    except ValueError:
+        return float('nan')
+
+
+def parse_date(value: str) -> np.datetime64:
+    """Parse a spreadsheet date like '3/1/2025' into a day-resolution datetime64"""
+    text = value.strip()
+    if not text:
+        return np.datetime64('NaT', 'D')
+    return np.datetime64(datetime.strptime(text, '%m/%d/%Y').date(), 'D')
+
+
+def to_day(value: DateLike) -> np.datetime64:
+    """Normalise a date-like value to a day-resolution datetime64"""
+    if isinstance(value, str) and '/' in value:
+        return parse_date(value)
+    return np.datetime64(value, 'D')
+
+
+@dataclass
+class TokenomicsSheet:
+    buckets: List[str]
+    allocation: np.ndarray   # float64 fraction of total supply per bucket
+    tokens: np.ndarray       # float64 token count per bucket
+    start: np.ndarray        # datetime64[D] first unlock day per bucket
+    end: np.ndarray          # datetime64[D] last unlock day per bucket
+    scalars: Dict[str, float]
+
+    @classmethod
+    def from_csv(cls, filepath: Union[str, Path]) -> 'TokenomicsSheet':
+        """Parse the multi-header tokenomics spreadsheet export"""
+        with open(filepath, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+
+        header_index = next((i for i, row in enumerate(rows)
+                             if row and row[0].strip() == 'Category'), None)
+        if header_index is None:
+            raise ValueError(f"No 'Category' header row found in {filepath}")
+
+        header = [cell.strip() for cell in rows[header_index]]
+        records = {row[0].strip(): row + [''] * (len(header) - len(row))
+                   for row in rows[header_index + 1:] if row and row[0].strip()}
+        for required in ('Net Supply', 'Net Tokens', 'Start Date', 'End Date'):
+            if required not in records:
+                raise ValueError(f"Missing '{required}' row in {filepath}")
+
+        # Allocation buckets sit between the Day column and the Net Circulating total
+        first = header.index('Day') + 1
+        last = header.index('Net Circulating')
+        columns = range(first, last)
+
+        buckets = [header[i] for i in columns]
+        allocation = np.array([parse_number(records['Net Supply'][i]) for i in columns])
+        tokens = np.array([parse_number(records['Net Tokens'][i]) for i in columns])
+        start = np.array([parse_date(records['Start Date'][i]) for i in columns],
+                         dtype='datetime64[D]')
+        end = np.array([parse_date(records['End Date'][i]) for i in columns],
+                       dtype='datetime64[D]')
+
+        scalars = {}
+        for name in SCALAR_COLUMNS:
+            if name in header:
+                scalars[name] = parse_number(records['Net Supply'][header.index(name)])
+
+        tokens = np.nan_to_num(tokens)
+        return cls(buckets, np.nan_to_num(allocation), tokens, start, end, scalars)
+
+    @property
+    def total_supply(self) -> float:
+        return self.scalars.get('Total Supply', float(self.tokens.sum()))
+
+    @property
+    def daily_inflation(self) -> float:
+        """Daily compounding rate equivalent to the sheet's Inflation (YOY)
+
+        The sheet's own Daily Inflation cell is rounded (0.16% compounds to
+        ~79%/yr against a stated 39.5%), so it is only used when YOY is missing.
+        """
+        yoy = self.scalars.get('Inflation (YOY)', float('nan'))
+        if np.isnan(yoy):
+            return self.scalars.get('Daily Inflation', 0.0)
+        return (1.0 + yoy) ** (1.0 / 365.0) - 1.0
+
+
+class VestingSchedule:
+    """Daily unlock schedule for every bucket, precomputed for O(1) lookups"""
+
+    def __init__(self, sheet: TokenomicsSheet):
+        self.sheet = sheet
+        self.buckets = sheet.buckets
+        self._bucket_index = {name: i for i, name in enumerate(sheet.buckets)}
+
+        # Buckets without dates (e.g. a 0-token reserve) never unlock
+        dated = ~(np.isnat(sheet.start) | np.isnat(sheet.end))
+        self.origin = sheet.start[dated].min()
+        self.last_day = sheet.end[dated].max()
+        self.days = np.arange(self.origin, self.last_day + 1, dtype='datetime64[D]')
+
+        # Linear vesting, inclusive of both the start and end day
+        offset = (self.days[:, None] - sheet.start[None, :]).astype(np.float64) + 1
+        length = (sheet.end - sheet.start).astype(np.float64) + 1
+        fraction = np.clip(offset / length[None, :], 0.0, 1.0)
+        fraction[:, ~dated] = 0.0
+
+        self.unlocked = fraction * sheet.tokens[None, :]
+        self.daily_unlocks = np.diff(self.unlocked, axis=0, prepend=0.0)
+        self.circulating = self.unlocked.sum(axis=1)
+
+        # Inflation mints new tokens on top of Total Supply from launch; minted
+        # tokens are treated as circulating immediately
+        self.emitted = self._emission(np.arange(len(self.days)))
+        self.daily_emission = np.diff(self.emitted, prepend=0.0)
+
+    @classmethod
+    def from_csv(cls, filepath: Union[str, Path]) -> 'VestingSchedule':
+        return cls(TokenomicsSheet.from_csv(filepath))
+
+    def _emission(self, elapsed: np.ndarray) -> np.ndarray:
+        """Tokens minted by inflation after the given number of days since launch"""
+        elapsed = np.maximum(np.asarray(elapsed, dtype=np.float64), 0.0)
+        return self.sheet.total_supply * ((1.0 + self.sheet.daily_inflation) ** elapsed - 1.0)
+
+    def _offset(self, when: DateLike) -> int:
+        """Days since launch; negative before launch and unbounded after the schedule"""
+        return int((to_day(when) - self.origin).astype(np.int64))
+
+    def _index(self, when: DateLike) -> int:
+        """Map a date to a row of the precomputed arrays (negative before launch)
+
+        Dates after the last unlock map to the final row, where vesting is complete.
+        """
+        return min(self._offset(when), len(self.days) - 1)
+
+    def _offsets(self, dates: Iterable[DateLike]) -> np.ndarray:
+        days = np.array([to_day(d) for d in dates], dtype='datetime64[D]')
+        return (days - self.origin).astype(np.int64)
+
+    def _indices(self, dates: Iterable[DateLike]) -> np.ndarray:
+        return np.minimum(self._offsets(dates), len(self.days) - 1)
+
+    def emitted_supply(self, when: DateLike) -> float:
+        """Tokens minted by inflation up to a date, extrapolated past the vesting schedule"""
+        return float(self._emission(self._offset(when)))
+
+    def total_supply(self, when: DateLike) -> float:
+        """Total Supply plus everything minted by inflation up to a date"""
+        return self.sheet.total_supply + self.emitted_supply(when)
+
+    def circulating_supply(self, when: DateLike, include_emission: bool = False) -> float:
+        """Circulating supply on a given date"""
+        offset = self._offset(when)
+        if offset < 0:
+            return 0.0
+        supply = self.circulating[min(offset, len(self.days) - 1)]
+        if include_emission:
+            supply += self._emission(offset)
+        return float(supply)
+
+    def unlocked_by_bucket(self, when: DateLike) -> Dict[str, float]:
+        """Cumulative unlocked tokens per bucket on a given date"""
+        i = self._index(when)
+        if i < 0:
+            return {name: 0.0 for name in self.buckets}
+        return dict(zip(self.buckets, self.unlocked[i].tolist()))
+
+    def bucket_unlocked(self, bucket: str, when: DateLike) -> float:
+        """Cumulative unlocked tokens for one bucket on a given date"""
+        i = self._index(when)
+        if i < 0:
+            return 0.0
+        return float(self.unlocked[i, self._bucket_index[bucket]])
+
+    def circulating_supply_batch(self, dates: Iterable[DateLike],
+                                 include_emission: bool = False) -> np.ndarray:
+        """Circulating supply for many dates at once"""
+        offsets = self._offsets(dates)
+        before = offsets < 0
+        supply = self.circulating[np.clip(offsets, 0, len(self.days) - 1)]
+        if include_emission:
+            supply = supply + self._emission(offsets)
+        return np.where(before, 0.0, supply)
+
+    def unlocked_batch(self, dates: Iterable[DateLike]) -> np.ndarray:
+        """Cumulative unlocked tokens per bucket for many dates, shape (dates, buckets)"""
+        indices = self._indices(dates)
+        before = indices < 0
+        unlocked = self.unlocked[np.where(before, 0, indices)]
+        unlocked[before] = 0.0
+        return unlocked
+
+    def summary(self, every_days: int = 90) -> List[Dict]:
+        """Sample the schedule at a fixed interval for reporting"""
+        rows = []
+        for i in range(0, len(self.days), every_days):
+            rows.append({
+                'date': str(self.days[i]),
+                'circulating': float(self.circulating[i]),
+                'percent': float(self.circulating[i] / self.sheet.total_supply * 100.0),
+                'emitted': float(self.emitted[i])
+            })
+        return rows
+
+
+def main(csv_path: Optional[str] = None):
+    path = csv_path or Path(__file__).resolve().parents[1] / 'SBX_LEGACY_TOKENOMICS.csv'
+    schedule = VestingSchedule.from_csv(path)
+
+    print("SBX Vesting Schedule:")
+    print("-" * 80)
+    for name, tokens, start, end in zip(schedule.buckets, schedule.sheet.tokens,
+                                        schedule.sheet.start, schedule.sheet.end):
+        print(f"{name:<16} {tokens:>14,.0f}  {start} -> {end}")
+
+    print("\nCirculating Supply:")
+    print("-" * 80)
+    for row in schedule.summary():
+        print(f"{row['date']}: {row['circulating']:>14,.0f} ({row['percent']:.2f}%)"
+              f"  +{row['emitted']:>14,.0f} minted")
+
+
+if __name__ == "__main__":
+    import sys
+    main(sys.argv[1] if len(sys.argv) > 1 else None)